@@ -1,14 +1,29 @@
 
-from flask import Flask, request, jsonify, send_from_directory, abort
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, abort
 from werkzeug.utils import secure_filename
 import os
+import re
 from pathlib import Path
 import sqlite3
-from datetime import datetime
+import itertools
+import functools
+import uuid
+from time import time_ns
+from contextlib import ExitStack
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import threading
+import multiprocessing
+from datetime import datetime, date, time, timedelta
 import pandas as pd
-from typing import List
-from llmutils import generate_sql, configure_openai
+import orjson
+from python_calamine import CalamineWorkbook
+from typing import Dict, List, Iterable, Iterator, Any, Tuple, Optional
+from llmutils import generate_sql, parse_column_names
+import dbpool
 from flask_cors import CORS
+from streaming_form_data import StreamingFormDataParser, ParseFailedException
+from streaming_form_data.targets import FileTarget
 
 ALLOWED_EXTENSIONS = {"xls", "xlsx", "csv", "ods"}
 
@@ -24,105 +39,356 @@ TMP_DIR.mkdir(parents=True, exist_ok=True)
 TEMPLATE_DIR = BASE_DIR / "template"
 TEMPLATE_DIR.mkdir(parents=True, exist_ok=True)
 
-app = Flask(__name__)
-app.config["UPLOAD_FOLDER"] = str(TMP_DIR)
-app.config["TEMPLATE_FOLDER"] = str(TEMPLATE_DIR)
-
-# Enable CORS for the app (allow access from other origins)
-CORS(app)
-
 # Static folders: serve frontend assets (index.html, favicon, /assets/...)
 STATIC_DIR = BASE_DIR / "static"
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
 ASSETS_DIR = STATIC_DIR / "assets"
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Cache-Control max-age for the frontend's static files (index.html excepted)
+STATIC_MAX_AGE = 86400
+
+
+class _App(Flask):
+	def get_send_file_max_age(self, filename: Optional[str]) -> Optional[int]:
+		# only static files may be cached; downloads of tmp/ and template/
+		# files must always reflect the latest conversion
+		if request.endpoint == "static":
+			return STATIC_MAX_AGE
+		return super().get_send_file_max_age(filename)
+
+
+# favicon.ico and /assets/... are served by Flask's built-in static route
+app = _App(__name__, static_folder=str(STATIC_DIR), static_url_path="")
+app.config["UPLOAD_FOLDER"] = str(TMP_DIR)
+app.config["TEMPLATE_FOLDER"] = str(TEMPLATE_DIR)
 app.config["STATIC_FOLDER"] = str(STATIC_DIR)
+# The same folders as plain strings, joined with os.path in request handlers
+_UPLOAD_DIR = app.config["UPLOAD_FOLDER"]
+_TEMPLATE_DIR = app.config["TEMPLATE_FOLDER"]
+_STATIC_DIR = app.config["STATIC_FOLDER"]
+# When running behind nginx/Apache, let the web server send file bodies
+app.config["USE_X_SENDFILE"] = os.getenv("USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
+
+# Enable CORS for the app (allow access from other origins)
+CORS(app)
+
+# Excel ingestion: rows are streamed into SQLite in batches of this size, and
+# column types are inferred from the first few data rows of each sheet.
+INGEST_BATCH_SIZE = 10_000
+TYPE_SAMPLE_ROWS = 100
+
+# Uploads: the request body is read and parsed in chunks of this size.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Query results are fetched from SQLite and streamed to the client in batches of this size.
+SQL_FETCH_SIZE = 1000
+
+# Characters not allowed in table names derived from sheet names.
+_TABLE_SAN_RE = re.compile(r"[^0-9a-zA-Z_]+")
+
+
+def _quote_ident(name: str) -> str:
+	"""Quote an SQLite identifier (table or column name)."""
+	return '"' + name.replace('"', '""') + '"'
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_table_name(sheet_name: str) -> str:
+	"""Derive a table name from a sheet name: keep alnum and underscore."""
+	return _TABLE_SAN_RE.sub("_", sheet_name) or "data"
+
+
+def _column_names(header: Iterable[Any]) -> List[str]:
+	"""Turn a sheet's header row into unique column names (pandas-style defaults)."""
+	names: List[str] = []
+	seen = {}
+	for i, h in enumerate(header):
+		name = str(h).strip() if h is not None else ""
+		if not name:
+			name = f"Unnamed: {i}"
+		if name in seen:
+			seen[name] += 1
+			name = f"{name}.{seen[name]}"
+		else:
+			seen[name] = 0
+		names.append(name)
+	return names
+
+
+def _cell_value(v: Any) -> Any:
+	"""Convert a spreadsheet cell value into something sqlite3 can bind."""
+	# calamine reports blank cells as "" and every number as a float
+	if v == "":
+		return None
+	if isinstance(v, float) and v.is_integer():
+		return int(v)
+	if isinstance(v, datetime):
+		return v.isoformat(sep=" ")
+	if isinstance(v, (date, time)):
+		return v.isoformat()
+	if isinstance(v, timedelta):
+		return str(v)
+	return v
+
+
+def _sqlite_type(values: Iterable[Any]) -> str:
+	"""Guess a SQLite column type from a sample of (converted) cell values.
+
+	A sample with no values at all yields NUMERIC: its affinity keeps later
+	numbers numeric and later text as text, whereas TEXT would turn numbers
+	into strings that no longer compare or sort as numbers.
+	"""
+	kinds = {type(v) for v in values if v is not None}
+	if not kinds:
+		return "NUMERIC"
+	if kinds <= {int, bool}:
+		return "INTEGER"
+	if kinds <= {int, bool, float}:
+		return "REAL"
+	return "TEXT"
+
+
+def _sqlite_type_for_dtype(dtype: Any) -> str:
+	"""Map a pandas dtype to a SQLite column type."""
+	if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+		return "INTEGER"
+	if pd.api.types.is_float_dtype(dtype):
+		return "REAL"
+	return "TEXT"
+
+
+def _create_table(cur: sqlite3.Cursor, table: str, columns: List[str], types: List[str]) -> List[Dict[str, Any]]:
+	"""(Re)create `table` with the given column names and SQLite types.
+
+	Returns the column details in the same shape as `PRAGMA table_info`
+	would report them for the new table.
+	"""
+	col_defs = ", ".join(f"{_quote_ident(col)} {typ}" for col, typ in zip(columns, types))
+	cur.execute(f"DROP TABLE IF EXISTS {_quote_ident(table)}")
+	cur.execute(f"CREATE TABLE {_quote_ident(table)} ({col_defs})")
+	return [{
+		"cid": cid,
+		"name": col,
+		"type": typ,
+		"notnull": False,
+		"default": None,
+		"pk": False,
+	} for cid, (col, typ) in enumerate(zip(columns, types))]
+
+
+def _insert_rows(cur: sqlite3.Cursor, table: str, width: int, rows: Iterable[tuple]) -> int:
+	"""Bulk insert `rows` with `executemany` in batches of `INGEST_BATCH_SIZE`; return the row count."""
+	insert_sql = f"INSERT INTO {_quote_ident(table)} VALUES ({', '.join('?' * width)})"
+	count = 0
+	it = iter(rows)
+	while True:
+		batch = list(itertools.islice(it, INGEST_BATCH_SIZE))
+		if not batch:
+			break
+		cur.executemany(insert_sql, batch)
+		count += len(batch)
+	return count
+
+
+def _write_rows(cur: sqlite3.Cursor, table: str, rows: Iterator[tuple]) -> Optional[Dict[str, Any]]:
+	"""Create `table` from the first row (header) of `rows` and bulk insert the rest.
+
+	Rows are consumed lazily and inserted in batches, so a sheet is never
+	fully held in memory. Returns `{"rows": count, "columns": [...]}` for the
+	written table, or None if there was no header row (empty sheet).
+	"""
+	header = next(rows, None)
+	if header is None:
+		return None
+	columns = _column_names(header)
+	width = len(columns)
+
+	def records():
+		for row in rows:
+			row = tuple(_cell_value(v) for v in row[:width])
+			if all(v is None for v in row):
+				continue
+			yield row + (None,) * (width - len(row))
+
+	data = records()
+	sample = list(itertools.islice(data, TYPE_SAMPLE_ROWS))
+	cols = _create_table(cur, table, columns, [_sqlite_type(r[i] for r in sample) for i in range(width)])
+	return {"rows": _insert_rows(cur, table, width, itertools.chain(sample, data)), "columns": cols}
+
+
+def _column_values(s: pd.Series) -> List[Any]:
+	"""Return a column as a list of Python scalars, with missing values as None."""
+	if (pd.api.types.is_numeric_dtype(s.dtype) or pd.api.types.is_bool_dtype(s.dtype)) and not s.hasnans:
+		# numpy's C-level tolist() boxes numeric arrays into Python int/float/bool
+		return s.to_numpy().tolist()
+	values = s.to_numpy(dtype=object, na_value=None).tolist()
+	if pd.api.types.is_datetime64_any_dtype(s.dtype) or pd.api.types.is_timedelta64_dtype(s.dtype):
+		# sqlite3 cannot bind pandas Timestamp/Timedelta; store them as text like sheet dates
+		return [None if pd.isna(v) else _cell_value(v) for v in values]
+	return values
+
+
+def _write_frame(cur: sqlite3.Cursor, table: str, df: pd.DataFrame) -> Dict[str, Any]:
+	"""Create `table` from a DataFrame's columns and dtypes and bulk insert its rows.
+
+	Values are converted column by column and zipped back into row tuples
+	for `executemany`. Returns `{"rows": count, "columns": [...]}` for the
+	written table.
+	"""
+	columns = [str(c) for c in df.columns]
+	cols = _create_table(cur, table, columns, [_sqlite_type_for_dtype(t) for t in df.dtypes])
+	col_values = [_column_values(df.iloc[:, i]) for i in range(len(columns))]
+	_insert_rows(cur, table, len(columns), zip(*col_values))
+	return {"rows": len(df), "columns": cols}
+
+
+# Bookkeeping files kept in the tmp folder that /browse does not list: conversion
+# status files, SQLite WAL/journal files and partial uploads.
+_BROWSE_HIDDEN_SUFFIXES = (".status.json", ".status.json.tmp", "-wal", "-shm", "-journal")
+_BROWSE_HIDDEN_PREFIX = ".upload-"
+
+# Last /browse listing as (folder path, folder mtime_ns, filenames).
+_browse_cache: Optional[Tuple[str, int, List[str]]] = None
 
 
 @app.route("/browse", methods=["GET"])
 def browse_tmp():
-	"""Return a JSON list of filenames in the tmp folder."""
-	p = Path(app.config["UPLOAD_FOLDER"])
-	files = [f.name for f in p.iterdir() if f.is_file()]
+	"""Return a JSON list of filenames in the tmp folder.
+
+	The listing is reused until the folder's mtime changes, i.e. until a file
+	is added, removed or renamed.
+	"""
+	global _browse_cache
+	folder = _UPLOAD_DIR
+	mtime = os.stat(folder).st_mtime_ns
+	cached = _browse_cache
+	if cached is not None and cached[0] == folder and cached[1] == mtime:
+		return jsonify({"files": cached[2]})
+
+	with os.scandir(folder) as it:
+		files = [
+			entry.name for entry in it
+			if entry.is_file(follow_symlinks=False)
+			and not entry.name.endswith(_BROWSE_HIDDEN_SUFFIXES)
+			and not entry.name.startswith(_BROWSE_HIDDEN_PREFIX)
+		]
+	# filesystem timestamps are coarse: a change made right after this scan could
+	# leave the mtime unchanged, so only cache listings of a folder that has settled
+	if time_ns() - mtime > 1_000_000_000:
+		_browse_cache = (folder, mtime, files)
 	return jsonify({"files": files})
 
 
-@app.route("/convert/<path:filename>", methods=["POST"])
-def convert_to_sqlite(filename: str):
-	"""Convert an Excel/CSV file in the tmp folder to a sqlite DB and write a metadata txt file.
+# Conversions run in worker processes so that parsing large workbooks neither
+# blocks a request thread nor serialises on the GIL.
+CONVERTIBLE_SUFFIXES = (".xls", ".xlsx", ".ods", ".csv")
+
+# Workers come from a fork server (spawned where that is unavailable, e.g. on
+# Windows) rather than being forked from the threaded server, whose pooled
+# connections and held locks a forked child would inherit. Those processes import
+# this module too, so the pool is only created on the first submission.
+_CONVERT_MP_CONTEXT = multiprocessing.get_context(
+	"forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
-	The created files are placed in the same `tmp/` folder and share the same base name:
+
+def _new_convert_executor() -> ProcessPoolExecutor:
+	return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_CONVERT_MP_CONTEXT)
+
+
+_convert_executor: Optional[ProcessPoolExecutor] = None
+_convert_executor_lock = threading.Lock()
+
+
+def _write_status(status_path: str, status: Dict[str, Any]) -> None:
+	"""Replace a conversion status file in one step, so pollers never read a partial file."""
+	tmp_path = status_path + ".tmp"
+	with open(tmp_path, "wb") as f:
+		f.write(orjson.dumps(status))
+	os.replace(tmp_path, status_path)
+
+
+def _convert_file(src_path: Path) -> Dict[str, Any]:
+	"""Convert an Excel/CSV file to a sqlite DB and write a metadata txt file next to it.
+
+	The created files share the source file's base name:
 	- `<name>.db` (SQLite DB)
 	- `<name>.txt` (metadata)
-	"""
-	safe_name = secure_filename(filename)
-	src_path = Path(app.config["UPLOAD_FOLDER"]) / safe_name
-	if not src_path.exists():
-		return jsonify({"error": "source file not found"}), 404
 
+	Returns `{"db", "metadata", "tables", "total_rows"}`, or `{"error", "detail"}`
+	if the conversion failed.
+	"""
 	suffix = src_path.suffix.lower()
 	base = src_path.stem
 
+	workbook = None
 	try:
-		# For Excel files, read all sheets into a dict; for CSV read a single DataFrame
-		if suffix in (".xls", ".xlsx"):
-			sheets = pd.read_excel(src_path, sheet_name=None)
-			# sheets is a dict: {sheet_name: DataFrame}
+		# Spreadsheets are parsed by calamine and streamed row by row; calamine
+		# loads a sheet's whole range when it is fetched, so each sheet is only
+		# fetched when the write loop reaches it. CSV is read into a single DataFrame
+		if suffix in (".xls", ".xlsx", ".ods"):
+			workbook = CalamineWorkbook.from_path(str(src_path))
+			sheets = ((name, iter(workbook.get_sheet_by_name(name).iter_rows())) for name in workbook.sheet_names)
 		elif suffix == ".csv":
-			sheets = {"data": pd.read_csv(src_path)}
+			sheets = iter([("data", pd.read_csv(src_path))])
 		else:
-			return jsonify({"error": "unsupported file type for conversion"}), 400
+			return {"error": "unsupported file type for conversion"}
 	except Exception as e:
-		return jsonify({"error": "failed to read source file", "detail": str(e)}), 500
+		return {"error": "failed to read source file", "detail": str(e)}
 
-	db_path = Path(app.config["UPLOAD_FOLDER"]) / f"{base}.db"
+	db_path = src_path.with_name(f"{base}.db")
+	conn = None
 	try:
-		conn = sqlite3.connect(db_path)
-		# write each sheet as its own table, sanitizing table names
-		table_names = []
-		for sheet_name, df in sheets.items():
-			# sanitize table name: keep alnum and underscore
-			table = __import__('re').sub(r"[^0-9a-zA-Z_]+", "_", str(sheet_name))
-			if table == "":
-				table = "data"
-			table_names.append((table, df))
-			# write dataframe to sqlite under table name
-			df.to_sql(table, conn, if_exists="replace", index=False)
-		conn.commit()
-		# after writing, gather schema info
+		# autocommit mode: the transaction below is managed explicitly
+		conn = sqlite3.connect(db_path, isolation_level=None)
+		# the DB is rebuilt from its source file, so tune it for a single bulk load
+		# and skip fsyncs until the connection is done
+		conn.execute("PRAGMA journal_mode=WAL")
+		conn.execute("PRAGMA synchronous=OFF")
+		conn.execute("PRAGMA temp_store=MEMORY")
+		conn.execute("PRAGMA cache_size=-131072")
 		cur = conn.cursor()
+		# write each sheet as its own table, sanitizing table names, in one transaction;
+		# row counts and column details are recorded as each table is written
+		schema_info: Dict[str, Dict[str, Any]] = {}
+		cur.execute("BEGIN IMMEDIATE")
+		for sheet_name, data in sheets:
+			table = _sanitize_table_name(str(sheet_name))
+			if isinstance(data, pd.DataFrame):
+				info = _write_frame(cur, table, data)
+			else:
+				info = _write_rows(cur, table, data)
+			# release this sheet before the next one is loaded
+			del data
+			if info is not None:
+				schema_info[table] = info
+		cur.execute("COMMIT")
+		# after writing, fetch the stored CREATE statements
 		cur.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-		tables = cur.fetchall()
-
-		schema_info = {}
-		for name, create_sql in tables:
-			# get columns info
-			cur.execute(f"PRAGMA table_info('{name}')")
-			cols = cur.fetchall()  # (cid, name, type, notnull, dflt_value, pk)
-			cur.execute(f"SELECT COUNT(*) FROM \"{name}\"")
-			row_count = cur.fetchone()[0]
-			schema_info[name] = {
-				"create_sql": create_sql,
-				"rows": row_count,
-				"columns": [{
-					"cid": c[0],
-					"name": c[1],
-					"type": c[2],
-					"notnull": bool(c[3]),
-					"default": c[4],
-					"pk": bool(c[5]),
-				} for c in cols]
-			}
-
-		conn.close()
+		for name, create_sql in cur.fetchall():
+			if name in schema_info:
+				schema_info[name]["create_sql"] = create_sql
+
+		# fold the WAL back into the main file: pooled readers keep the DB open,
+		# so closing this connection would not checkpoint it, and /download
+		# sends only the `.db` file
+		conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+		conn.execute("PRAGMA synchronous=NORMAL")
 	except Exception as e:
-		return jsonify({"error": "failed to write sqlite db or gather schema", "detail": str(e)}), 500
+		return {"error": "failed to write sqlite db or gather schema", "detail": str(e)}
+	finally:
+		# closing also rolls back a transaction left open by a failed write
+		if conn is not None:
+			conn.close()
+		if workbook is not None:
+			workbook.close()
 
 	# create metadata file with richer schema details
-	meta_path = Path(app.config["UPLOAD_FOLDER"]) / f"{base}.txt"
+	meta_path = src_path.with_name(f"{base}.txt")
 	try:
 		with open(meta_path, "w", encoding="utf-8") as mf:
-			mf.write(f"source: {safe_name}\n")
+			mf.write(f"source: {src_path.name}\n")
 			mf.write(f"created: {datetime.utcnow().isoformat()}Z\n")
 			# overall summary
 			total_rows = sum(info.get("rows", 0) for info in schema_info.values())
@@ -138,14 +404,129 @@ def convert_to_sqlite(filename: str):
 				for col in info.get('columns', []):
 					mf.write(f"- {col['name']}: {col['type']}, pk={col['pk']}, notnull={col['notnull']}, default={col['default']}\n")
 	except Exception as e:
-		return jsonify({"error": "failed to write metadata file", "detail": str(e)}), 500
+		return {"error": "failed to write metadata file", "detail": str(e)}
 
-	return jsonify({
+	return {
 		"db": db_path.name,
 		"metadata": meta_path.name,
 		"tables": list(schema_info.keys()),
 		"total_rows": total_rows,
-	}), 201
+	}
+
+
+def _do_convert(src_path: str, status_path: str, job_id: str) -> Dict[str, Any]:
+	"""Worker-process entry point: run `_convert_file` and record the outcome in `status_path`."""
+	source = Path(src_path).name
+	_write_status(status_path, {"job": job_id, "status": "running", "source": source})
+	try:
+		result = _convert_file(Path(src_path))
+	except Exception as e:
+		result = {"error": "conversion failed", "detail": str(e)}
+	status = {"job": job_id, "status": "failed" if "error" in result else "done", "source": source, **result}
+	_write_status(status_path, status)
+	return status
+
+
+def _convert_done(status_path: str, status: Dict[str, Any], future: Future) -> None:
+	"""Mark a job failed if its worker process died before `_do_convert` recorded an outcome."""
+	if future.cancelled():
+		detail = "cancelled"
+	elif future.exception() is not None:
+		e = future.exception()
+		detail = str(e) or type(e).__name__
+	else:
+		return
+	try:
+		with open(status_path, "rb") as f:
+			if orjson.loads(f.read()).get("job") != status["job"]:
+				# a newer conversion of the same file owns the status file now
+				return
+	except (OSError, ValueError):
+		pass
+	_write_status(status_path, {
+		"job": status["job"],
+		"status": "failed",
+		"source": status["source"],
+		"error": "conversion failed",
+		"detail": detail,
+	})
+
+
+def _submit_convert(src_path: str, status_path: str, status: Dict[str, Any]) -> Future:
+	"""Queue `_do_convert`, replacing the process pool if a dead worker has broken it."""
+	global _convert_executor
+	with _convert_executor_lock:
+		if _convert_executor is None:
+			_convert_executor = _new_convert_executor()
+		try:
+			future = _convert_executor.submit(_do_convert, src_path, status_path, status["job"])
+		except BrokenProcessPool:
+			_convert_executor.shutdown(wait=False)
+			_convert_executor = _new_convert_executor()
+			future = _convert_executor.submit(_do_convert, src_path, status_path, status["job"])
+	future.add_done_callback(functools.partial(_convert_done, status_path, status))
+	return future
+
+
+@app.route("/convert/<path:filename>", methods=["POST"])
+def convert_to_sqlite(filename: str):
+	"""Start converting an Excel/CSV file in the tmp folder to a sqlite DB and a metadata txt file.
+
+	The conversion runs in a background worker process. The created files are
+	placed in the same `tmp/` folder and share the same base name:
+	- `<name>.db` (SQLite DB)
+	- `<name>.txt` (metadata)
+	- `<name>.status.json` (job status: pending, running, done or failed)
+
+	Returns 202 with the job status; poll `GET /convert/<filename>` until it is
+	done (it then also carries `tables` and `total_rows`) or failed (`error`, `detail`).
+	"""
+	safe_name = secure_filename(filename)
+	src_path = os.path.join(_UPLOAD_DIR, safe_name)
+	if not os.path.isfile(src_path):
+		return jsonify({"error": "source file not found"}), 404
+	base, suffix = os.path.splitext(safe_name)
+	if suffix.lower() not in CONVERTIBLE_SUFFIXES:
+		return jsonify({"error": "unsupported file type for conversion"}), 400
+
+	status_path = os.path.join(_UPLOAD_DIR, f"{base}.status.json")
+	status = {
+		"job": uuid.uuid4().hex,
+		"status": "pending",
+		"source": safe_name,
+		"db": f"{base}.db",
+		"metadata": f"{base}.txt",
+	}
+	try:
+		_write_status(status_path, status)
+		_submit_convert(src_path, status_path, status)
+	except Exception as e:
+		return jsonify({"error": "failed to start conversion", "detail": str(e)}), 500
+	return jsonify(status), 202
+
+
+@app.route("/convert/<path:filename>", methods=["GET"])
+def convert_status(filename: str):
+	"""Return the status of the latest conversion of `filename` (see `convert_to_sqlite`)."""
+	safe_name = secure_filename(filename)
+	status_path = os.path.join(_UPLOAD_DIR, f"{os.path.splitext(safe_name)[0]}.status.json")
+	if not os.path.isfile(status_path):
+		return jsonify({"error": "no conversion found"}), 404
+	with open(status_path, "rb") as f:
+		return Response(f.read(), mimetype="application/json")
+
+
+def _json_default(value: Any) -> Any:
+	"""orjson fallback for SQLite values it cannot encode: BLOBs become hex strings."""
+	if isinstance(value, (bytes, bytearray, memoryview)):
+		return bytes(value).hex()
+	raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_rows(rows: List[tuple]) -> bytes:
+	"""Encode a batch of rows as comma-separated JSON arrays (without the enclosing brackets)."""
+	# rows stay as tuples: orjson writes them as JSON arrays directly
+	return orjson.dumps(rows, default=_json_default)[1:-1]
 
 
 @app.route("/sql/<path:filename>", methods=["POST"])
@@ -154,11 +535,12 @@ def execute_sql(filename: str):
 
 	Request JSON body: {"query": "SELECT ..."}
 	Only statements beginning with SELECT are allowed (read-only).
-	Returns JSON: {"columns": [...], "rows": [{col: val, ...}, ...]}
+	Returns JSON: {"columns": [...], "rows": [[val, ...], ...]}, with each row's
+	values in the same order as `columns`. BLOB values are returned as hex strings.
 	"""
 	safe_name = secure_filename(filename)
-	db_path = Path(app.config["UPLOAD_FOLDER"]) / safe_name
-	if not db_path.exists():
+	db_path = os.path.join(_UPLOAD_DIR, safe_name)
+	if not os.path.isfile(db_path):
 		return jsonify({"error": "db file not found"}), 404
 
 	body = request.get_json(silent=True) or {}
@@ -172,23 +554,59 @@ def execute_sql(filename: str):
 	if not qs.lower().startswith("select"):
 		return jsonify({"error": "only SELECT queries are allowed"}), 400
 
+	# the pooled connection stays checked out until the response has been sent
+	stack = ExitStack()
 	try:
-		conn = sqlite3.connect(db_path)
-		conn.row_factory = sqlite3.Row
+		conn = stack.enter_context(dbpool.acquire(db_path))
 		cur = conn.cursor()
+		# runs before the connection is released, so no half-read statement
+		# (and its read snapshot) goes back into the pool
+		stack.callback(cur.close)
+		cur.arraysize = SQL_FETCH_SIZE
 		cur.execute(qs)
-		rows = cur.fetchall()
 		cols: List[str]
 		if cur.description:
 			cols = [d[0] for d in cur.description]
 		else:
 			cols = []
-		result = [dict(r) for r in rows]
-		conn.close()
+		# fetch and encode the first batch before any of the body is sent, so
+		# errors there still get an error response rather than a truncated body
+		first = _encode_rows(cur.fetchmany())
+	except dbpool.PoolExhausted as e:
+		stack.close()
+		return jsonify({"error": "database busy, try again later", "detail": str(e)}), 503
 	except Exception as e:
+		stack.close()
 		return jsonify({"error": "query failed", "detail": str(e)}), 500
 
-	return jsonify({"columns": cols, "rows": result})
+	def generate():
+		try:
+			yield b'{"columns":' + orjson.dumps(cols) + b',"rows":[' + first
+			while True:
+				batch = cur.fetchmany()
+				if not batch:
+					break
+				yield b"," + _encode_rows(batch)
+			yield b"]}"
+		finally:
+			stack.close()
+
+	response = Response(generate(), mimetype="application/json")
+	# also release the connection if the client goes away before streaming starts
+	response.call_on_close(stack.close)
+	return response
+
+
+@functools.lru_cache(maxsize=128)
+def _load_metadata(meta_path: str, mtime_ns: int) -> Tuple[str, Tuple[str, ...]]:
+	"""Read a metadata file and parse its column names.
+
+	`mtime_ns` is only part of the cache key: re-converting a DB rewrites its
+	metadata file, which changes the mtime and so bypasses the stale entry.
+	"""
+	with open(meta_path, encoding="utf-8") as f:
+		text = f.read()
+	return text, tuple(parse_column_names(text))
 
 
 @app.route("/llm/generate/<path:db_filename>", methods=["POST"])
@@ -199,8 +617,8 @@ def llm_generate(db_filename: str):
 	Returns JSON from `generate_sql` (sql, raw, ok, error).
 	"""
 	safe_name = secure_filename(db_filename)
-	db_path = Path(app.config["UPLOAD_FOLDER"]) / safe_name
-	if not db_path.exists():
+	db_path = os.path.join(_UPLOAD_DIR, safe_name)
+	if not os.path.isfile(db_path):
 		return jsonify({"error": "db file not found"}), 404
 
 	body = request.get_json(silent=True) or {}
@@ -211,37 +629,34 @@ def llm_generate(db_filename: str):
 	table = body.get("table") or "data"
 
 	# Read metadata plaintext if available
-	meta_path = Path(app.config["UPLOAD_FOLDER"]) / f"{Path(safe_name).stem}.txt"
-	if meta_path.exists():
+	meta_path = os.path.join(_UPLOAD_DIR, f"{os.path.splitext(safe_name)[0]}.txt")
+	parsed_cols: Optional[Tuple[str, ...]] = None
+	if os.path.isfile(meta_path):
 		try:
-			metadata_text = meta_path.read_text(encoding="utf-8")
+			metadata_text, parsed_cols = _load_metadata(meta_path, os.stat(meta_path).st_mtime_ns)
 		except Exception as e:
 			return jsonify({"error": "failed to read metadata file", "detail": str(e)}), 500
 	else:
 		# Fallback: construct simple metadata from sqlite schema
 		try:
-			conn = sqlite3.connect(db_path)
-			cur = conn.cursor()
-			cur.execute(f"PRAGMA table_info('{table}')")
-			cols = cur.fetchall()
-			cur.execute(f"SELECT COUNT(*) FROM \"{table}\"")
-			try:
-				row_count = cur.fetchone()[0]
-			except Exception:
-				row_count = 0
-			conn.close()
+			with dbpool.acquire(db_path) as conn:
+				cur = conn.cursor()
+				# table name bound as a parameter so the statement is prepared once and reused
+				cur.execute('SELECT cid, name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)', (table,))
+				cols = cur.fetchall()
+				cur.execute("SELECT COUNT(*) FROM " + _quote_ident(table))
+				try:
+					row_count = cur.fetchone()[0]
+				except Exception:
+					row_count = 0
 			col_names = ", ".join([c[1] for c in cols])
 			metadata_text = f"source: {safe_name}\nrows: {row_count}\ncolumns: {len(cols)}\ncolumn_names: {col_names}\n"
+		except dbpool.PoolExhausted as e:
+			return jsonify({"error": "database busy, try again later", "detail": str(e)}), 503
 		except Exception as e:
 			metadata_text = f"source: {safe_name}\n(could not read schema: {e})\n"
 
-	# ensure llm client configured
-	try:
-		configure_openai()
-	except Exception:
-		pass
-
-	result = generate_sql(table, metadata_text, user_request)
+	result = generate_sql(table, metadata_text, user_request, columns=parsed_cols)
 	return jsonify(result)
 
 
@@ -250,75 +665,99 @@ def health():
 	return jsonify({"status": "ok"})
 
 
+class _UploadTarget(FileTarget):
+	"""FileTarget that records whether its part ran up to the closing boundary."""
+
+	def __init__(self, filename: str):
+		super().__init__(filename)
+		self.complete = False
+
+	def on_finish(self):
+		super().on_finish()
+		self.complete = True
+
+	def close(self) -> None:
+		"""Close the output file of a part that was cut off before it finished."""
+		if self._fd is not None and not self._fd.closed:
+			self._fd.close()
+
+
 @app.route("/upload", methods=["POST"])
 def upload_file():
-	if "file" not in request.files:
+	"""Save the `file` part of a multipart upload into the tmp folder.
+
+	The body is parsed incrementally from `request.stream` and the file part is
+	written straight to a temporary file, then renamed once its filename has
+	been validated (bypassing Werkzeug's `request.files` form parser).
+	"""
+	if request.mimetype != "multipart/form-data":
 		return jsonify({"error": "no file part"}), 400
-	file = request.files["file"]
-	if file.filename == "":
-		return jsonify({"error": "no selected file"}), 400
-	if not allowed_file(file.filename):
-		return jsonify({"error": "file type not allowed"}), 400
-	filename = secure_filename(file.filename)
-	save_path = Path(app.config["UPLOAD_FOLDER"]) / filename
-	file.save(save_path)
+
+	tmp_path = os.path.join(_UPLOAD_DIR, f".upload-{uuid.uuid4().hex}.part")
+	target = _UploadTarget(tmp_path)
+	try:
+		try:
+			parser = StreamingFormDataParser(headers=request.headers)
+			parser.register("file", target)
+			while True:
+				chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+				if not chunk:
+					break
+				parser.data_received(chunk)
+		except ParseFailedException as e:
+			return jsonify({"error": "malformed multipart body", "detail": str(e)}), 400
+
+		if target.multipart_filename is None:
+			return jsonify({"error": "no file part"}), 400
+		if target.multipart_filename == "":
+			return jsonify({"error": "no selected file"}), 400
+		if not target.complete:
+			# the body ended (client aborted or truncated it) before the file part did
+			return jsonify({"error": "incomplete upload"}), 400
+		if not allowed_file(target.multipart_filename):
+			return jsonify({"error": "file type not allowed"}), 400
+		filename = secure_filename(target.multipart_filename)
+		save_path = os.path.join(_UPLOAD_DIR, filename)
+		os.replace(tmp_path, save_path)
+	finally:
+		target.close()
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
 	return jsonify({"filename": filename}), 201
 
 
 @app.route("/download/<path:filename>", methods=["GET"])
 def download_file(filename: str):
 	safe_name = secure_filename(filename)
-	file_path = Path(app.config["UPLOAD_FOLDER"]) / safe_name
-	if not file_path.exists():
+	if not os.path.isfile(os.path.join(_UPLOAD_DIR, safe_name)):
 		abort(404)
-	return send_from_directory(app.config["UPLOAD_FOLDER"], safe_name, as_attachment=True)
+	return send_from_directory(_UPLOAD_DIR, safe_name, as_attachment=True)
 
 
 @app.route("/template", methods=["GET"])
 def download_default_template():
 	name = "template.xlsx"
-	file_path = Path(app.config["TEMPLATE_FOLDER"]) / name
-	if not file_path.exists():
+	if not os.path.isfile(os.path.join(_TEMPLATE_DIR, name)):
 		abort(404)
-	return send_from_directory(app.config["TEMPLATE_FOLDER"], name, as_attachment=True)
+	return send_from_directory(_TEMPLATE_DIR, name, as_attachment=True)
 
 
 @app.route("/template/<path:filename>", methods=["GET"])
 def download_template(filename: str):
 	safe_name = secure_filename(filename)
-	file_path = Path(app.config["TEMPLATE_FOLDER"]) / safe_name
-	if not file_path.exists():
+	if not os.path.isfile(os.path.join(_TEMPLATE_DIR, safe_name)):
 		abort(404)
-	return send_from_directory(app.config["TEMPLATE_FOLDER"], safe_name, as_attachment=True)
+	return send_from_directory(_TEMPLATE_DIR, safe_name, as_attachment=True)
 
 
 # Serve index.html from the static folder
 @app.route("/", methods=["GET"])
 def serve_index():
-	index_path = Path(app.config.get("STATIC_FOLDER", "")) / "index.html"
-	print(index_path)
-	if not index_path.exists():
-		abort(404)
-	return send_from_directory(app.config.get("STATIC_FOLDER"), "index.html")
-
-
-# Serve favicon.ico
-@app.route("/favicon.ico", methods=["GET"])
-def serve_favicon():
-	fav_path = Path(app.config.get("STATIC_FOLDER", "")) / "favicon.ico"
-	if not fav_path.exists():
-		abort(404)
-	return send_from_directory(app.config.get("STATIC_FOLDER"), "favicon.ico")
-
-
-# Serve files under static/assets/
-@app.route("/assets/<path:filename>", methods=["GET"])
-def serve_assets(filename: str):
-	safe_name = secure_filename(filename)
-	file_path = Path(app.config.get("STATIC_FOLDER", "")) / "assets" / safe_name
-	if not file_path.exists():
+	index_path = os.path.join(_STATIC_DIR, "index.html")
+	if not os.path.isfile(index_path):
 		abort(404)
-	return send_from_directory(str(Path(app.config.get("STATIC_FOLDER", "")) / "assets"), safe_name)
+	# revalidate on every load (If-None-Match -> 304) so new asset bundles are picked up
+	return send_file(index_path, conditional=True, etag=True, max_age=0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""
+dbpool.py
+
+Process-wide pool of SQLite connections, keyed by database path, shared by
+the request handlers in `app.py` so that each request does not pay for
+opening (and tearing down the WAL/SHM files of) a fresh connection.
+
+Connections are opened lazily, in autocommit mode, with `check_same_thread`
+disabled so that any worker thread may borrow them. At most `POOL_SIZE`
+connections are opened per database; further callers wait up to
+`POOL_TIMEOUT` seconds for one to be returned, then get `PoolExhausted`.
+
+Functions:
+ - acquire(db_path)
+"""
+from typing import Dict, Iterator
+from contextlib import contextmanager
+import queue
+import sqlite3
+import threading
+
+# Maximum number of open connections per database file.
+POOL_SIZE = 8
+
+# Seconds to wait for a connection when all of them are checked out.
+POOL_TIMEOUT = 10
+
+# Applied to every new pooled connection.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+class PoolExhausted(Exception):
+    """No pooled connection became free within `POOL_TIMEOUT` seconds."""
+
+
+class _Pool:
+    def __init__(self, db_path: str, size: int):
+        self.db_path = db_path
+        self.size = size
+        self.idle: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            grow = self.opened < self.size
+            if grow:
+                self.opened += 1
+        if grow:
+            try:
+                return self._connect()
+            except Exception:
+                with self.lock:
+                    self.opened -= 1
+                raise
+        try:
+            return self.idle.get(timeout=POOL_TIMEOUT)
+        except queue.Empty:
+            raise PoolExhausted(f"no free connection to {self.db_path} after {POOL_TIMEOUT}s") from None
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        self.idle.put(conn)
+
+
+_pools: Dict[str, _Pool] = {}
+_pools_lock = threading.Lock()
+
+
+@contextmanager
+def acquire(db_path) -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection to `db_path` for the duration of a `with` block."""
+    key = str(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(key, _Pool(key, POOL_SIZE))
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
@@ -10,20 +10,28 @@ This module will look for LLM configuration in environment variables or a
 
 Functions:
  - configure_openai(api_base=None, api_key=None, model=None)
- - build_prompt(table_name, metadata, user_request)
+ - parse_column_names(metadata_text)
+ - build_prompt(table_name, metadata, user_request, columns=None)
  - extract_sql(text)
- - generate_sql(table_name, metadata, user_request, model=None)
+ - generate_sql(table_name, metadata, user_request, model=None, columns=None)
  - validate_sql(sql, table_name)
  - run_sqlite_query(db_path, sql)
 """
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Sequence
 import re
+import functools
 import json
 import os
 from pathlib import Path
+import httpx
 from openai import OpenAI
 CLIENT: Optional[OpenAI] = None
 
+# HTTP connection pool shared by every OpenAI client created by `configure_openai`,
+# so keep-alive connections (and TLS sessions) survive reconfiguration.
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+_HTTP_CLIENT: Optional[httpx.Client] = None
+
 # --- Configuration ---
 # Default fallbacks; overridden by environment variables or `llm_config.json`.
 API_BASE = ""
@@ -33,6 +41,22 @@ DEFAULT_MODEL = "gpt-5.2"
 # Config file (optional) placed next to this module. Example JSON:
 # { "api_key": "...", "api_base": "https://.../v1", "model": "gpt-5.2" }
 CONFIG_FILE = Path(__file__).resolve().parent / "llm_config.json"
+# mtime of CONFIG_FILE when the client was last configured.
+_CONFIG_MTIME: Optional[int] = None
+
+# Patterns used on every LLM response, compiled once.
+_FENCE_RE = re.compile(r"```(?:sql)?\n(.*?)```", re.S | re.I)
+_SELECT_LINE_RE = re.compile(r"^select\b", re.I)
+_FORBIDDEN_RE = re.compile(r"\b(drop|delete|insert|update|alter|create|attach|detach|pragma)\b", re.I)
+_COLNAMES_RE = re.compile(r"column_names:\s*(.*)", re.I)
+
+
+def _config_mtime() -> Optional[int]:
+    """Modification time of `llm_config.json` in nanoseconds, or None if it is missing."""
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def _load_llm_config() -> Dict[str, Optional[str]]:
@@ -75,8 +99,11 @@ def configure_openai(api_base: Optional[str] = None, api_key: Optional[str] = No
 
     If `model` is provided (or available via env/config) it will override
     the module `DEFAULT_MODEL` for subsequent calls.
+
+    The client sends requests over a shared HTTP/2 connection pool.
     """
-    global CLIENT, DEFAULT_MODEL
+    global CLIENT, DEFAULT_MODEL, _HTTP_CLIENT, _CONFIG_MTIME
+    _CONFIG_MTIME = _config_mtime()
     cfg = _load_llm_config()
 
     base = api_base or cfg.get("api_base") or API_BASE
@@ -86,10 +113,109 @@ def configure_openai(api_base: Optional[str] = None, api_key: Optional[str] = No
     if chosen_model:
         DEFAULT_MODEL = chosen_model
 
-    CLIENT = OpenAI(api_key=key, base_url=base)
-
-
-def build_prompt(table_name: str, metadata: Union[Dict[str, Any], str], user_request: str) -> str:
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(http2=True, limits=HTTP_LIMITS)
+    CLIENT = OpenAI(api_key=key, base_url=base, http_client=_HTTP_CLIENT)
+
+
+# Prompt budget for table metadata: at most this many columns per table and
+# this many characters of metadata text in total.
+PROMPT_MAX_COLUMNS = 50
+PROMPT_MAX_METADATA_CHARS = 4000
+
+# Fixed instructions that open every prompt built by `build_prompt`.
+_PROMPT_HEADER = (
+    "You are an assistant that writes precise SQLite SELECT statements.\n"
+    "The user will provide a search request describing what data they want.\n"
+    "Constraints:\n"
+    "- Output ONLY a single valid SQLite `SELECT` statement and nothing else.\n"
+    "- Do not include any surrounding explanation, markdown, or code fences.\n"
+    "- The statement must be read-only (SELECT). No INSERT/UPDATE/DELETE/PRAGMA/ATTACH.\n"
+    "- Use the table name exactly as provided.\n"
+    "- Use SQLite-compatible syntax.\n"
+    "- Prefer explicit column lists (not SELECT *), unless user requests all columns.\n"
+    "Here is the table metadata (raw):\n"
+)
+
+
+def parse_column_names(metadata_text: str) -> List[str]:
+    """Extract column names from a `column_names: a, b, c` line in plaintext metadata."""
+    m = _COLNAMES_RE.search(metadata_text)
+    if not m:
+        return []
+    return [c.strip() for c in m.group(1).split(",") if c.strip()]
+
+
+@functools.lru_cache(maxsize=128)
+def _truncate_metadata(meta_text: str, table_name: str) -> str:
+    """Shorten plaintext metadata (as written by `convert_to_sqlite`) for the prompt.
+
+    Every line except the `column_details:` entries and the `create_sql:` lines
+    is kept, so each table's `[table]`, `rows` and `columns` lines always survive.
+    The rest of the `PROMPT_MAX_METADATA_CHARS` budget goes to column details, at
+    most `PROMPT_MAX_COLUMNS` per table, `table_name`'s first and then the other
+    tables in file order; what is left goes to the `create_sql:` lines of tables
+    whose details were kept in full.
+    """
+    # [table name, lines up to `column_details:`, detail entries, lines after them];
+    # the first section holds the lines before any `[table]`
+    sections: List[List[Any]] = [[None, [], [], []]]
+    in_details = False
+    for line in meta_text.splitlines():
+        if line.startswith("[table] "):
+            sections.append([line[len("[table] "):].strip(), [], [], []])
+        section = sections[-1]
+        if in_details and line.startswith("- "):
+            section[2].append(line)
+            continue
+        in_details = line.strip() == "column_details:"
+        (section[3] if section[2] else section[1]).append(line)
+
+    budget = PROMPT_MAX_METADATA_CHARS - sum(
+        len(line) + 1
+        for _, head, _, tail in sections
+        for line in head + tail
+        if not line.startswith("create_sql: ")
+    )
+    wanted = (table_name or "").casefold()
+    order = sorted(range(len(sections)), key=lambda i: (sections[i][0] or "").casefold() != wanted)
+    kept = [0] * len(sections)
+    for i in order:
+        details = sections[i][2]
+        # room for the "more columns" marker in case not every entry fits
+        marker = len(f"- ... ({len(details)} more columns)") + 1 if details else 0
+        budget -= marker
+        for line in details[:PROMPT_MAX_COLUMNS]:
+            if len(line) + 1 > budget:
+                break
+            budget -= len(line) + 1
+            kept[i] += 1
+        if kept[i] == len(details):
+            budget += marker
+    with_create = set()
+    for i in order:
+        if kept[i] == len(sections[i][2]):
+            size = sum(len(line) + 1 for line in sections[i][1] if line.startswith("create_sql: "))
+            if size <= budget:
+                budget -= size
+                with_create.add(i)
+
+    out: List[str] = []
+    for i, (_, head, details, tail) in enumerate(sections):
+        out.extend(line for line in head if i in with_create or not line.startswith("create_sql: "))
+        out.extend(details[:kept[i]])
+        if kept[i] < len(details):
+            out.append(f"- ... ({len(details) - kept[i]} more columns)")
+        out.extend(tail)
+
+    text = "\n".join(out)
+    if len(text) > PROMPT_MAX_METADATA_CHARS:
+        # only reached when the header lines alone exceed the budget
+        text = text[:PROMPT_MAX_METADATA_CHARS].rstrip() + "\n... (metadata truncated)"
+    return text
+
+
+def build_prompt(table_name: str, metadata: Union[Dict[str, Any], str], user_request: str, columns: Optional[Sequence[str]] = None) -> str:
     """Create a clear instruction prompt for the LLM.
 
     `metadata` may be either a parsed dict (old format) or a plaintext string
@@ -97,36 +223,38 @@ def build_prompt(table_name: str, metadata: Union[Dict[str, Any], str], user_req
 
     When given plaintext, this function will attempt a lightweight parse to
     extract `column_names` if present and include both the raw metadata and
-    a short parsed view in the prompt to help the LLM.
+    a short parsed view in the prompt to help the LLM. Callers that cache the
+    metadata can pass the already parsed `columns` to skip that step.
+
+    To bound prompt size, only the first `PROMPT_MAX_COLUMNS` columns per table
+    and `PROMPT_MAX_METADATA_CHARS` characters of metadata are included, with
+    `table_name`'s columns given precedence over those of other tables.
     """
     # If metadata is a plain string, attempt to parse column names and rows
-    parsed_cols: List[str] = []
+    parsed_cols: Sequence[str] = []
     meta_text = ""
     if isinstance(metadata, str):
-        meta_text = metadata
+        meta_text = _truncate_metadata(metadata, table_name)
         # look for a line like: column_names: a, b, c
-        m = re.search(r"column_names:\s*(.*)", metadata, re.I)
-        if m:
-            parsed_cols = [c.strip() for c in m.group(1).split(",") if c.strip()]
+        parsed_cols = columns if columns is not None else parse_column_names(metadata)
     elif isinstance(metadata, dict):
         # keep compatibility with existing dict-shaped metadata
-        meta_text = json.dumps(metadata, ensure_ascii=False)
         cols = metadata.get("columns") or metadata.get("column_names") or []
         parsed_cols = [c["name"] if isinstance(c, dict) and c.get("name") else c for c in cols]
+        if len(cols) > PROMPT_MAX_COLUMNS:
+            metadata = {k: v for k, v in metadata.items() if k != "column_names"}
+            metadata["columns"] = cols[:PROMPT_MAX_COLUMNS]
+        meta_text = json.dumps(metadata, ensure_ascii=False)
+        if len(meta_text) > PROMPT_MAX_METADATA_CHARS:
+            meta_text = meta_text[:PROMPT_MAX_METADATA_CHARS] + " ... (metadata truncated)"
+
+    if len(parsed_cols) > PROMPT_MAX_COLUMNS:
+        parsed_cols = list(parsed_cols[:PROMPT_MAX_COLUMNS]) + [f"... ({len(parsed_cols) - PROMPT_MAX_COLUMNS} more columns)"]
 
     columns_text = "\n".join([f"- {c}" for c in parsed_cols]) if parsed_cols else "(no column list available)"
 
     prompt = (
-        "You are an assistant that writes precise SQLite SELECT statements.\n"
-        "The user will provide a search request describing what data they want.\n"
-        "Constraints:\n"
-        "- Output ONLY a single valid SQLite `SELECT` statement and nothing else.\n"
-        "- Do not include any surrounding explanation, markdown, or code fences.\n"
-        "- The statement must be read-only (SELECT). No INSERT/UPDATE/DELETE/PRAGMA/ATTACH.\n"
-        "- Use the table name exactly as provided.\n"
-        "- Use SQLite-compatible syntax.\n"
-        "- Prefer explicit column lists (not SELECT *), unless user requests all columns.\n"
-        "Here is the table metadata (raw):\n"
+        f"{_PROMPT_HEADER}"
         f"{meta_text}\n\n"
         "Parsed columns:\n"
         f"{columns_text}\n\n"
@@ -147,8 +275,12 @@ def extract_sql(text: str) -> Optional[str]:
     # strip leading/trailing whitespace
     s = text.strip()
 
+    # Fast path: the model was asked for a bare SELECT and usually returns just that
+    if "```" not in s and _SELECT_LINE_RE.match(s):
+        return s.rstrip(';').rstrip()
+
     # If model returned code fences, extract inner content
-    m = re.search(r"```(?:sql)?\n(.*?)```", s, re.S | re.I)
+    m = _FENCE_RE.search(s)
     if m:
         candidate = m.group(1).strip()
     else:
@@ -163,12 +295,12 @@ def extract_sql(text: str) -> Optional[str]:
     # Sometimes model may include an explanation line; find the first line that starts with SELECT
     lines = [ln.strip() for ln in candidate.splitlines() if ln.strip()]
     for i in range(len(lines)):
-        if re.match(r"^(select)\b", lines[i], re.I):
+        if _SELECT_LINE_RE.match(lines[i]):
             sql = " ".join(lines[i:])
             return sql.strip()
 
     # fallback: if the whole candidate starts with select
-    if re.match(r"^select\b", candidate, re.I):
+    if _SELECT_LINE_RE.match(candidate):
         return candidate
 
     return None
@@ -178,13 +310,18 @@ def validate_sql(sql: str, table_name: str) -> bool:
     """Basic validation: ensure it's a SELECT, no forbidden keywords, and uses table name."""
     if not sql:
         return False
+    return _validate_sql_cached(sql, table_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_sql_cached(sql: str, table_name: str) -> bool:
+    """Memoized body of `validate_sql`: with temperature=0 the model often repeats itself."""
     s = sql.strip()
-    if not re.match(r"^select\b", s, re.I):
+    if not _SELECT_LINE_RE.match(s):
         return False
 
     # disallow write or schema-changing statements
-    forbidden = re.compile(r"\b(drop|delete|insert|update|alter|create|attach|detach|pragma)\b", re.I)
-    if forbidden.search(s):
+    if _FORBIDDEN_RE.search(s):
         return False
 
     # table_name presence (simple check)
@@ -196,13 +333,15 @@ def validate_sql(sql: str, table_name: str) -> bool:
     return True
 
 
-def generate_sql(table_name: str, metadata: Union[Dict[str, Any], str], user_request: str, model: Optional[str] = None, max_tokens: int = 256) -> Dict[str, Any]:
+def generate_sql(table_name: str, metadata: Union[Dict[str, Any], str], user_request: str, model: Optional[str] = None, max_tokens: int = 256, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
     """Ask the LLM to produce a SELECT SQL statement.
 
+    `columns` is forwarded to `build_prompt` (pre-parsed column names).
+
     Returns a dict: {"sql": str or None, "raw": str (model output), "ok": bool, "error": str}
     """
     model_to_use = model or DEFAULT_MODEL
-    prompt = build_prompt(table_name, metadata, user_request)
+    prompt = build_prompt(table_name, metadata, user_request, columns=columns)
 
     # messages style for chat completion
     messages = [
@@ -212,7 +351,7 @@ def generate_sql(table_name: str, metadata: Union[Dict[str, Any], str], user_req
 
     try:
         global CLIENT
-        if CLIENT is None:
+        if CLIENT is None or _config_mtime() != _CONFIG_MTIME:
             configure_openai()
         resp = CLIENT.chat.completions.create(model=model_to_use, messages=messages, max_tokens=max_tokens, temperature=0)
         raw = resp.choices[0].message.content
@@ -231,5 +370,12 @@ def generate_sql(table_name: str, metadata: Union[Dict[str, Any], str], user_req
 
 
 
+# Configure the client once at import; `generate_sql` configures it again if
+# this failed or `llm_config.json` has changed since.
+try:
+    configure_openai()
+except Exception:
+    CLIENT = None
+
 
 # Module is intended to be imported and used as a helper; no CLI/demo code.
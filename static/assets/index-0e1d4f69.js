@@ -20,7 +20,7 @@
 * vue v3.5.27
 * (c) 2018-present Yuxi (Evan) You and Vue contributors
 * @license MIT
-**/const Qh=()=>{},eo=Object.freeze(Object.defineProperty({__proto__:null,BaseTransition:Nc,BaseTransitionPropsValidators:Vi,Comment:Ce,DeprecationTypes:uh,EffectScope:wi,ErrorCodes:gf,ErrorTypeStrings:sh,Fragment:he,KeepAlive:Yf,ReactiveEffect:ls,Static:an,Suspense:Ud,Teleport:Af,Text:kt,TrackOpTypes:uf,Transition:ph,TransitionGroup:Dh,TriggerOpTypes:ff,VueElement:xr,assertNumber:mf,callWithAsyncErrorHandling:st,callWithErrorHandling:Hn,camelize:we,capitalize:Ts,cloneVNode:bt,compatUtils:ah,compile:Qh,computed:sn,createApp:fr,createBlock:ir,createCommentVNode:ai,createElementBlock:Re,createElementVNode:X,createHydrationRenderer:Qc,createPropsRestProxy:pd,createRenderer:Jc,createSSRApp:Da,createSlots:zf,createStaticVNode:Gd,createTextVNode:Ji,createVNode:ge,customRef:oc,defineAsyncComponent:Kf,defineComponent:Wn,defineCustomElement:Na,defineEmits:rd,defineExpose:id,defineModel:cd,defineOptions:ld,defineProps:sd,defineSSRCustomElement:wh,defineSlots:od,devtools:rh,effect:wu,effectScope:Ho,getCurrentInstance:Ve,getCurrentScope:Wo,getCurrentWatcher:df,getTransitionRawChildren:Ir,guardReactiveProps:oa,h:kr,handleError:hn,hasInjectionContext:Lf,hydrate:Xh,hydrateOnIdle:$f,hydrateOnInteraction:jf,hydrateOnMediaQuery:Wf,hydrateOnVisible:Hf,initCustomFormatter:eh,initDirectivesForSSR:Jh,inject:On,isMemoSame:pa,isProxy:Cs,isReactive:Pt,isReadonly:gt,isRef:Te,isRuntimeOnly:Qd,isShallow:Ge,isVNode:Dt,markRaw:ic,mergeDefaults:dd,mergeModels:hd,mergeProps:ca,nextTick:Sr,nodeOps:ga,normalizeClass:Vn,normalizeProps:Lu,normalizeStyle:vs,onActivated:Oc,onBeforeMount:wc,onBeforeUnmount:Pr,onBeforeUpdate:Wi,onDeactivated:Ac,onErrorCaptured:Fc,onMounted:pn,onRenderTracked:xc,onRenderTriggered:kc,onScopeDispose:Au,onServerPrefetch:Rc,onUnmounted:Ns,onUpdated:Ar,onWatcherCleanup:ac,openBlock:Le,patchProp:Sa,popScopeId:vf,provide:_c,proxyRefs:Mi,pushScopeId:Tf,queuePostFlushCb:as,reactive:Cr,readonly:Qs,ref:je,registerRuntimeCompiler:Jd,render:Ma,renderList:nn,renderSlot:ed,resolveComponent:Jf,resolveDirective:Zf,resolveDynamicComponent:Qf,resolveFilter:ch,resolveTransitionHooks:Rn,setBlockTracking:ps,setDevtoolsHook:ih,setTransitionHooks:Mt,shallowReactive:rc,shallowReadonly:Qu,shallowRef:Fi,ssrContextKey:mc,ssrUtils:oh,stop:Ru,toDisplayString:be,toHandlerKey:Zn,toHandlers:td,toRaw:re,toRef:of,toRefs:sf,toValue:ef,transformVNodeArgs:Bd,triggerRef:zu,unref:ye,useAttrs:fd,useCssModule:xh,useCssVars:yh,useHost:Ia,useId:wf,useModel:Cd,useSSRContext:gc,useShadowRoot:kh,useSlots:ud,useTemplateRef:Rf,useTransitionState:$i,vModelCheckbox:Zi,vModelDynamic:wa,vModelRadio:zi,vModelSelect:rs,vModelText:Fn,vShow:Ca,version:_a,warn:nh,watch:wt,watchEffect:Sf,watchPostEffect:Nf,watchSyncEffect:bc,withAsyncContext:_d,withCtx:Ui,withDefaults:ad,withDirectives:Tn,withKeys:qh,withMemo:th,withModifiers:Gh,withScopeId:Cf},Symbol.toStringTag,{value:"Module"})),jn={}.VITE_API_BASE||"";async function Os(e){const t=await e.text();if(!e.ok)try{return JSON.parse(t)}catch{throw new Error(t||e.statusText)}try{return JSON.parse(t)}catch{return{}}}async function Zh(){const e=await fetch(`${jn}/browse`);return Os(e)}async function zh(e){const t=new FormData;t.append("file",e);const n=await fetch(`${jn}/upload`,{method:"POST",body:t});return Os(n)}async function ep(e){const t=await fetch(`${jn}/convert/${encodeURIComponent(e)}`,{method:"POST"});return Os(t)}async function tp(e,t){const n=await fetch(`${jn}/sql/${encodeURIComponent(e)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:t})});return Os(n)}async function np(e,t,n){const s={request:t};n&&(s.table=n);const r=await fetch(`${jn}/llm/generate/${encodeURIComponent(e)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(s)});return Os(r)}function sp(e){return`${jn}/download/${encodeURIComponent(e)}`}/*!
+**/const Qh=()=>{},eo=Object.freeze(Object.defineProperty({__proto__:null,BaseTransition:Nc,BaseTransitionPropsValidators:Vi,Comment:Ce,DeprecationTypes:uh,EffectScope:wi,ErrorCodes:gf,ErrorTypeStrings:sh,Fragment:he,KeepAlive:Yf,ReactiveEffect:ls,Static:an,Suspense:Ud,Teleport:Af,Text:kt,TrackOpTypes:uf,Transition:ph,TransitionGroup:Dh,TriggerOpTypes:ff,VueElement:xr,assertNumber:mf,callWithAsyncErrorHandling:st,callWithErrorHandling:Hn,camelize:we,capitalize:Ts,cloneVNode:bt,compatUtils:ah,compile:Qh,computed:sn,createApp:fr,createBlock:ir,createCommentVNode:ai,createElementBlock:Re,createElementVNode:X,createHydrationRenderer:Qc,createPropsRestProxy:pd,createRenderer:Jc,createSSRApp:Da,createSlots:zf,createStaticVNode:Gd,createTextVNode:Ji,createVNode:ge,customRef:oc,defineAsyncComponent:Kf,defineComponent:Wn,defineCustomElement:Na,defineEmits:rd,defineExpose:id,defineModel:cd,defineOptions:ld,defineProps:sd,defineSSRCustomElement:wh,defineSlots:od,devtools:rh,effect:wu,effectScope:Ho,getCurrentInstance:Ve,getCurrentScope:Wo,getCurrentWatcher:df,getTransitionRawChildren:Ir,guardReactiveProps:oa,h:kr,handleError:hn,hasInjectionContext:Lf,hydrate:Xh,hydrateOnIdle:$f,hydrateOnInteraction:jf,hydrateOnMediaQuery:Wf,hydrateOnVisible:Hf,initCustomFormatter:eh,initDirectivesForSSR:Jh,inject:On,isMemoSame:pa,isProxy:Cs,isReactive:Pt,isReadonly:gt,isRef:Te,isRuntimeOnly:Qd,isShallow:Ge,isVNode:Dt,markRaw:ic,mergeDefaults:dd,mergeModels:hd,mergeProps:ca,nextTick:Sr,nodeOps:ga,normalizeClass:Vn,normalizeProps:Lu,normalizeStyle:vs,onActivated:Oc,onBeforeMount:wc,onBeforeUnmount:Pr,onBeforeUpdate:Wi,onDeactivated:Ac,onErrorCaptured:Fc,onMounted:pn,onRenderTracked:xc,onRenderTriggered:kc,onScopeDispose:Au,onServerPrefetch:Rc,onUnmounted:Ns,onUpdated:Ar,onWatcherCleanup:ac,openBlock:Le,patchProp:Sa,popScopeId:vf,provide:_c,proxyRefs:Mi,pushScopeId:Tf,queuePostFlushCb:as,reactive:Cr,readonly:Qs,ref:je,registerRuntimeCompiler:Jd,render:Ma,renderList:nn,renderSlot:ed,resolveComponent:Jf,resolveDirective:Zf,resolveDynamicComponent:Qf,resolveFilter:ch,resolveTransitionHooks:Rn,setBlockTracking:ps,setDevtoolsHook:ih,setTransitionHooks:Mt,shallowReactive:rc,shallowReadonly:Qu,shallowRef:Fi,ssrContextKey:mc,ssrUtils:oh,stop:Ru,toDisplayString:be,toHandlerKey:Zn,toHandlers:td,toRaw:re,toRef:of,toRefs:sf,toValue:ef,transformVNodeArgs:Bd,triggerRef:zu,unref:ye,useAttrs:fd,useCssModule:xh,useCssVars:yh,useHost:Ia,useId:wf,useModel:Cd,useSSRContext:gc,useShadowRoot:kh,useSlots:ud,useTemplateRef:Rf,useTransitionState:$i,vModelCheckbox:Zi,vModelDynamic:wa,vModelRadio:zi,vModelSelect:rs,vModelText:Fn,vShow:Ca,version:_a,warn:nh,watch:wt,watchEffect:Sf,watchPostEffect:Nf,watchSyncEffect:bc,withAsyncContext:_d,withCtx:Ui,withDefaults:ad,withDirectives:Tn,withKeys:qh,withMemo:th,withModifiers:Gh,withScopeId:Cf},Symbol.toStringTag,{value:"Module"})),jn={}.VITE_API_BASE||"";async function Os(e){const t=await e.text();if(!e.ok)try{return JSON.parse(t)}catch{throw new Error(t||e.statusText)}try{return JSON.parse(t)}catch{return{}}}async function Zh(){const e=await fetch(`${jn}/browse`);return Os(e)}async function zh(e){const t=new FormData;t.append("file",e);const n=await fetch(`${jn}/upload`,{method:"POST",body:t});return Os(n)}async function ep(e){const t=`${jn}/convert/${encodeURIComponent(e)}`,n=await fetch(t,{method:"POST"});let s=await Os(n);if(!n.ok)throw new Error(s.detail||s.error||n.statusText);for(;s.status!=="done";){if(s.status==="failed")throw new Error(s.detail||s.error||"failed");await new Promise(o=>setTimeout(o,500));const o=await fetch(t);if(s=await Os(o),!o.ok)throw new Error(s.error||o.statusText)}return s}async function tp(e,t){const n=await fetch(`${jn}/sql/${encodeURIComponent(e)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:t})});return Os(n)}async function np(e,t,n){const s={request:t};n&&(s.table=n);const r=await fetch(`${jn}/llm/generate/${encodeURIComponent(e)}`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(s)});return Os(r)}function sp(e){return`${jn}/download/${encodeURIComponent(e)}`}/*!
   * shared v11.2.8
   * (c) 2025 kazuya kawaguchi
   * Released under the MIT License.
@@ -38,4 +38,4 @@
   * vue-i18n v11.2.8
   * (c) 2025 kazuya kawaguchi
   * Released under the MIT License.
-  */const k_="11.2.8";function x_(){typeof __VUE_I18N_FULL_INSTALL__!="boolean"&&(rn().__VUE_I18N_FULL_INSTALL__=!0),typeof __VUE_I18N_LEGACY_API__!="boolean"&&(rn().__VUE_I18N_LEGACY_API__=!0),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(rn().__INTLIFY_DROP_MESSAGE_COMPILER__=!1),typeof __INTLIFY_PROD_DEVTOOLS__!="boolean"&&(rn().__INTLIFY_PROD_DEVTOOLS__=!1)}const Ye={UNEXPECTED_RETURN_TYPE:Zp,INVALID_ARGUMENT:25,MUST_BE_CALL_SETUP_TOP:26,NOT_INSTALLED:27,REQUIRED_VALUE:28,INVALID_VALUE:29,CANNOT_SETUP_VUE_DEVTOOLS_PLUGIN:30,NOT_INSTALLED_WITH_PROVIDE:31,UNEXPECTED_ERROR:32,NOT_COMPATIBLE_LEGACY_VUE_I18N:33,NOT_AVAILABLE_COMPOSITION_IN_LEGACY:34};function Qe(e,...t){return Mr(e,null,void 0)}const Ci=Xt("__translateVNode"),Li=Xt("__datetimeParts"),Si=Xt("__numberParts"),lu=Xt("__setPluralRules"),ou=Xt("__injectWithOption"),Ni=Xt("__dispose");function bs(e){if(!oe(e)||mt(e))return e;for(const t in e)if(lt(e,t))if(!t.includes("."))oe(e[t])&&bs(e[t]);else{const n=t.split("."),s=n.length-1;let r=e,i=!1;for(let l=0;l<s;l++){if(n[l]==="__proto__")throw new Error(`unsafe key: ${n[l]}`);if(n[l]in r||(r[n[l]]=de()),!oe(r[n[l]])){i=!0;break}r=r[n[l]]}if(i||(mt(r)?Xa.includes(n[s])||delete e[t]:(r[n[s]]=e[t],delete e[t])),!mt(r)){const l=r[n[s]];oe(l)&&bs(l)}}return e}function ll(e,t){const{messages:n,__i18n:s,messageResolver:r,flatJson:i}=t,l=Z(n)?n:Ee(s)?de():{[e]:de()};if(Ee(s)&&s.forEach(o=>{if("locale"in o&&"resource"in o){const{locale:c,resource:u}=o;c?(l[c]=l[c]||de(),qs(u,l[c])):qs(u,l)}else j(o)&&qs(JSON.parse(o),l)}),r==null&&i)for(const o in l)lt(l,o)&&bs(l[o]);return l}function cu(e){return e.type}function au(e,t,n){let s=oe(t.messages)?t.messages:de();"__i18nGlobal"in n&&(s=ll(e.locale.value,{messages:s,__i18n:n.__i18nGlobal}));const r=Object.keys(s);r.length&&r.forEach(i=>{e.mergeLocaleMessage(i,s[i])});{if(oe(t.datetimeFormats)){const i=Object.keys(t.datetimeFormats);i.length&&i.forEach(l=>{e.mergeDateTimeFormat(l,t.datetimeFormats[l])})}if(oe(t.numberFormats)){const i=Object.keys(t.numberFormats);i.length&&i.forEach(l=>{e.mergeNumberFormat(l,t.numberFormats[l])})}}}function Co(e){return ge(kt,null,e,0)}function ys(){const e="currentInstance";return e in eo?eo[e]:Ve()}const Lo="__INTLIFY_META__",So=()=>[],F_=()=>!1;let No=0;function Io(e){return(t,n,s,r)=>e(n,s,ys()||void 0,r)}const M_=()=>{const e=ys();let t=null;return e&&(t=cu(e)[Lo])?{[Lo]:t}:null};function ol(e={}){const{__root:t,__injectWithOption:n}=e,s=t===void 0,r=e.flatJson,i=dr?je:Fi;let l=ie(e.inheritLocale)?e.inheritLocale:!0;const o=i(t&&l?t.locale.value:j(e.locale)?e.locale:gs),c=i(t&&l?t.fallbackLocale.value:j(e.fallbackLocale)||Ee(e.fallbackLocale)||Z(e.fallbackLocale)||e.fallbackLocale===!1?e.fallbackLocale:o.value),u=i(ll(o.value,e)),a=i(Z(e.datetimeFormats)?e.datetimeFormats:{[o.value]:{}}),p=i(Z(e.numberFormats)?e.numberFormats:{[o.value]:{}});let g=t?t.missingWarn:ie(e.missingWarn)||Dn(e.missingWarn)?e.missingWarn:!0,L=t?t.fallbackWarn:ie(e.fallbackWarn)||Dn(e.fallbackWarn)?e.fallbackWarn:!0,O=t?t.fallbackRoot:ie(e.fallbackRoot)?e.fallbackRoot:!0,S=!!e.fallbackFormat,k=me(e.missing)?e.missing:null,b=me(e.missing)?Io(e.missing):null,y=me(e.postTranslation)?e.postTranslation:null,h=t?t.warnHtmlMessage:ie(e.warnHtmlMessage)?e.warnHtmlMessage:!0,f=!!e.escapeParameter;const T=t?t.modifiers:Z(e.modifiers)?e.modifiers:{};let N=e.pluralRules||t&&t.pluralRules,I;I=(()=>{s&&po(null);const E={version:k_,locale:o.value,fallbackLocale:c.value,messages:u.value,modifiers:T,pluralRules:N,missing:b===null?void 0:b,missingWarn:g,fallbackWarn:L,fallbackFormat:S,unresolving:!0,postTranslation:y===null?void 0:y,warnHtmlMessage:h,escapeParameter:f,messageResolver:e.messageResolver,messageCompiler:e.messageCompiler,__meta:{framework:"vue"}};E.datetimeFormats=a.value,E.numberFormats=p.value,E.__datetimeFormatters=Z(I)?I.__datetimeFormatters:void 0,E.__numberFormatters=Z(I)?I.__numberFormatters:void 0;const A=b_(E);return s&&po(A),A})(),Xn(I,o.value,c.value);function x(){return[o.value,c.value,u.value,a.value,p.value]}const D=sn({get:()=>o.value,set:E=>{I.locale=E,o.value=E}}),W=sn({get:()=>c.value,set:E=>{I.fallbackLocale=E,c.value=E,Xn(I,o.value,E)}}),F=sn(()=>u.value),Y=sn(()=>a.value),z=sn(()=>p.value);function fe(){return me(y)?y:null}function G(E){y=E,I.postTranslation=E}function Q(){return k}function B(E){E!==null&&(b=Io(E)),k=E,I.missing=b}const te=(E,A,H,q,ne,se)=>{x();let ve;try{__INTLIFY_PROD_DEVTOOLS__,s||(I.fallbackContext=t?g_():void 0),ve=E(I)}finally{__INTLIFY_PROD_DEVTOOLS__,s||(I.fallbackContext=void 0)}if(H!=="translate exists"&&Ne(ve)&&ve===Dr||H==="translate exists"&&!ve){const[Oe,ze]=A();return t&&O?q(t):ne(Oe)}else{if(se(ve))return ve;throw Qe(Ye.UNEXPECTED_RETURN_TYPE)}};function yt(...E){return te(A=>Reflect.apply(vo,null,[A,...E]),()=>vi(...E),"translate",A=>Reflect.apply(A.t,A,[...E]),A=>A,A=>j(A))}function Ze(...E){const[A,H,q]=E;if(q&&!oe(q))throw Qe(Ye.INVALID_ARGUMENT);return yt(A,H,Ie({resolvedMessage:!0},q||{}))}function He(...E){return te(A=>Reflect.apply(mo,null,[A,...E]),()=>Ei(...E),"datetime format",A=>Reflect.apply(A.d,A,[...E]),()=>fo,A=>j(A)||Ee(A))}function _n(...E){return te(A=>Reflect.apply(bo,null,[A,...E]),()=>Ti(...E),"number format",A=>Reflect.apply(A.n,A,[...E]),()=>fo,A=>j(A)||Ee(A))}function Bn(E){return E.map(A=>j(A)||Ne(A)||ie(A)?Co(String(A)):A)}const Et={normalize:Bn,interpolate:E=>E,type:"vnode"};function $t(...E){return te(A=>{let H;const q=A;try{q.processor=Et,H=Reflect.apply(vo,null,[q,...E])}finally{q.processor=null}return H},()=>vi(...E),"translate",A=>A[Ci](...E),A=>[Co(A)],A=>Ee(A))}function Vt(...E){return te(A=>Reflect.apply(bo,null,[A,...E]),()=>Ti(...E),"number format",A=>A[Si](...E),So,A=>j(A)||Ee(A))}function mn(...E){return te(A=>Reflect.apply(mo,null,[A,...E]),()=>Ei(...E),"datetime format",A=>A[Li](...E),So,A=>j(A)||Ee(A))}function rt(E){N=E,I.pluralRules=N}function Zt(E,A){return te(()=>{if(!E)return!1;const H=j(A)?A:o.value,q=v(H),ne=I.messageResolver(q,E);return mt(ne)||tt(ne)||j(ne)},()=>[E],"translate exists",H=>Reflect.apply(H.te,H,[E,A]),F_,H=>ie(H))}function zt(E){let A=null;const H=Ja(I,c.value,o.value);for(let q=0;q<H.length;q++){const ne=u.value[H[q]]||{},se=I.messageResolver(ne,E);if(se!=null){A=se;break}}return A}function m(E){const A=zt(E);return A??(t?t.tm(E)||{}:{})}function v(E){return u.value[E]||{}}function w(E,A){if(r){const H={[E]:A};for(const q in H)lt(H,q)&&bs(H[q]);A=H[E]}u.value[E]=A,I.messages=u.value}function U(E,A){u.value[E]=u.value[E]||{};const H={[E]:A};if(r)for(const q in H)lt(H,q)&&bs(H[q]);A=H[E],qs(A,u.value[E]),I.messages=u.value}function M(E){return a.value[E]||{}}function d(E,A){a.value[E]=A,I.datetimeFormats=a.value,go(I,E,A)}function _(E,A){a.value[E]=Ie(a.value[E]||{},A),I.datetimeFormats=a.value,go(I,E,A)}function C(E){return p.value[E]||{}}function P(E,A){p.value[E]=A,I.numberFormats=p.value,yo(I,E,A)}function R(E,A){p.value[E]=Ie(p.value[E]||{},A),I.numberFormats=p.value,yo(I,E,A)}No++,t&&dr&&(wt(t.locale,E=>{l&&(o.value=E,I.locale=E,Xn(I,o.value,c.value))}),wt(t.fallbackLocale,E=>{l&&(c.value=E,I.fallbackLocale=E,Xn(I,o.value,c.value))}));const V={id:No,locale:D,fallbackLocale:W,get inheritLocale(){return l},set inheritLocale(E){l=E,E&&t&&(o.value=t.locale.value,c.value=t.fallbackLocale.value,Xn(I,o.value,c.value))},get availableLocales(){return Object.keys(u.value).sort()},messages:F,get modifiers(){return T},get pluralRules(){return N||{}},get isGlobal(){return s},get missingWarn(){return g},set missingWarn(E){g=E,I.missingWarn=g},get fallbackWarn(){return L},set fallbackWarn(E){L=E,I.fallbackWarn=L},get fallbackRoot(){return O},set fallbackRoot(E){O=E},get fallbackFormat(){return S},set fallbackFormat(E){S=E,I.fallbackFormat=S},get warnHtmlMessage(){return h},set warnHtmlMessage(E){h=E,I.warnHtmlMessage=E},get escapeParameter(){return f},set escapeParameter(E){f=E,I.escapeParameter=E},t:yt,getLocaleMessage:v,setLocaleMessage:w,mergeLocaleMessage:U,getPostTranslationHandler:fe,setPostTranslationHandler:G,getMissingHandler:Q,setMissingHandler:B,[lu]:rt};return V.datetimeFormats=Y,V.numberFormats=z,V.rt=Ze,V.te=Zt,V.tm=m,V.d=He,V.n=_n,V.getDateTimeFormat=M,V.setDateTimeFormat=d,V.mergeDateTimeFormat=_,V.getNumberFormat=C,V.setNumberFormat=P,V.mergeNumberFormat=R,V[ou]=n,V[Ci]=$t,V[Li]=mn,V[Si]=Vt,V}function D_(e){const t=j(e.locale)?e.locale:gs,n=j(e.fallbackLocale)||Ee(e.fallbackLocale)||Z(e.fallbackLocale)||e.fallbackLocale===!1?e.fallbackLocale:t,s=me(e.missing)?e.missing:void 0,r=ie(e.silentTranslationWarn)||Dn(e.silentTranslationWarn)?!e.silentTranslationWarn:!0,i=ie(e.silentFallbackWarn)||Dn(e.silentFallbackWarn)?!e.silentFallbackWarn:!0,l=ie(e.fallbackRoot)?e.fallbackRoot:!0,o=!!e.formatFallbackMessages,c=Z(e.modifiers)?e.modifiers:{},u=e.pluralizationRules,a=me(e.postTranslation)?e.postTranslation:void 0,p=j(e.warnHtmlInMessage)?e.warnHtmlInMessage!=="off":!0,g=!!e.escapeParameterHtml,L=ie(e.sync)?e.sync:!0;let O=e.messages;if(Z(e.sharedMessages)){const T=e.sharedMessages;O=Object.keys(T).reduce((I,$)=>{const x=I[$]||(I[$]={});return Ie(x,T[$]),I},O||{})}const{__i18n:S,__root:k,__injectWithOption:b}=e,y=e.datetimeFormats,h=e.numberFormats,f=e.flatJson;return{locale:t,fallbackLocale:n,messages:O,flatJson:f,datetimeFormats:y,numberFormats:h,missing:s,missingWarn:r,fallbackWarn:i,fallbackRoot:l,fallbackFormat:o,modifiers:c,pluralRules:u,postTranslation:a,warnHtmlMessage:p,escapeParameter:g,messageResolver:e.messageResolver,inheritLocale:L,__i18n:S,__root:k,__injectWithOption:b}}function Ii(e={}){const t=ol(D_(e)),{__extender:n}=e,s={id:t.id,get locale(){return t.locale.value},set locale(r){t.locale.value=r},get fallbackLocale(){return t.fallbackLocale.value},set fallbackLocale(r){t.fallbackLocale.value=r},get messages(){return t.messages.value},get datetimeFormats(){return t.datetimeFormats.value},get numberFormats(){return t.numberFormats.value},get availableLocales(){return t.availableLocales},get missing(){return t.getMissingHandler()},set missing(r){t.setMissingHandler(r)},get silentTranslationWarn(){return ie(t.missingWarn)?!t.missingWarn:t.missingWarn},set silentTranslationWarn(r){t.missingWarn=ie(r)?!r:r},get silentFallbackWarn(){return ie(t.fallbackWarn)?!t.fallbackWarn:t.fallbackWarn},set silentFallbackWarn(r){t.fallbackWarn=ie(r)?!r:r},get modifiers(){return t.modifiers},get formatFallbackMessages(){return t.fallbackFormat},set formatFallbackMessages(r){t.fallbackFormat=r},get postTranslation(){return t.getPostTranslationHandler()},set postTranslation(r){t.setPostTranslationHandler(r)},get sync(){return t.inheritLocale},set sync(r){t.inheritLocale=r},get warnHtmlInMessage(){return t.warnHtmlMessage?"warn":"off"},set warnHtmlInMessage(r){t.warnHtmlMessage=r!=="off"},get escapeParameterHtml(){return t.escapeParameter},set escapeParameterHtml(r){t.escapeParameter=r},get pluralizationRules(){return t.pluralRules||{}},__composer:t,t(...r){return Reflect.apply(t.t,t,[...r])},rt(...r){return Reflect.apply(t.rt,t,[...r])},te(r,i){return t.te(r,i)},tm(r){return t.tm(r)},getLocaleMessage(r){return t.getLocaleMessage(r)},setLocaleMessage(r,i){t.setLocaleMessage(r,i)},mergeLocaleMessage(r,i){t.mergeLocaleMessage(r,i)},d(...r){return Reflect.apply(t.d,t,[...r])},getDateTimeFormat(r){return t.getDateTimeFormat(r)},setDateTimeFormat(r,i){t.setDateTimeFormat(r,i)},mergeDateTimeFormat(r,i){t.mergeDateTimeFormat(r,i)},n(...r){return Reflect.apply(t.n,t,[...r])},getNumberFormat(r){return t.getNumberFormat(r)},setNumberFormat(r,i){t.setNumberFormat(r,i)},mergeNumberFormat(r,i){t.mergeNumberFormat(r,i)}};return s.__extender=n,s}function U_(e,t,n){return{beforeCreate(){const s=ys();if(!s)throw Qe(Ye.UNEXPECTED_ERROR);const r=this.$options;if(r.i18n){const i=r.i18n;if(r.__i18n&&(i.__i18n=r.__i18n),i.__root=t,this===this.$root)this.$i18n=Oo(e,i);else{i.__injectWithOption=!0,i.__extender=n.__vueI18nExtend,this.$i18n=Ii(i);const l=this.$i18n;l.__extender&&(l.__disposer=l.__extender(this.$i18n))}}else if(r.__i18n)if(this===this.$root)this.$i18n=Oo(e,r);else{this.$i18n=Ii({__i18n:r.__i18n,__injectWithOption:!0,__extender:n.__vueI18nExtend,__root:t});const i=this.$i18n;i.__extender&&(i.__disposer=i.__extender(this.$i18n))}else this.$i18n=e;r.__i18nGlobal&&au(t,r,r),this.$t=(...i)=>this.$i18n.t(...i),this.$rt=(...i)=>this.$i18n.rt(...i),this.$te=(i,l)=>this.$i18n.te(i,l),this.$d=(...i)=>this.$i18n.d(...i),this.$n=(...i)=>this.$i18n.n(...i),this.$tm=i=>this.$i18n.tm(i),n.__setInstance(s,this.$i18n)},mounted(){},unmounted(){const s=ys();if(!s)throw Qe(Ye.UNEXPECTED_ERROR);const r=this.$i18n;delete this.$t,delete this.$rt,delete this.$te,delete this.$d,delete this.$n,delete this.$tm,r.__disposer&&(r.__disposer(),delete r.__disposer,delete r.__extender),n.__deleteInstance(s),delete this.$i18n}}}function Oo(e,t){e.locale=t.locale||e.locale,e.fallbackLocale=t.fallbackLocale||e.fallbackLocale,e.missing=t.missing||e.missing,e.silentTranslationWarn=t.silentTranslationWarn||e.silentFallbackWarn,e.silentFallbackWarn=t.silentFallbackWarn||e.silentFallbackWarn,e.formatFallbackMessages=t.formatFallbackMessages||e.formatFallbackMessages,e.postTranslation=t.postTranslation||e.postTranslation,e.warnHtmlInMessage=t.warnHtmlInMessage||e.warnHtmlInMessage,e.escapeParameterHtml=t.escapeParameterHtml||e.escapeParameterHtml,e.sync=t.sync||e.sync,e.__composer[lu](t.pluralizationRules||e.pluralizationRules);const n=ll(e.locale,{messages:t.messages,__i18n:t.__i18n});return Object.keys(n).forEach(s=>e.mergeLocaleMessage(s,n[s])),t.datetimeFormats&&Object.keys(t.datetimeFormats).forEach(s=>e.mergeDateTimeFormat(s,t.datetimeFormats[s])),t.numberFormats&&Object.keys(t.numberFormats).forEach(s=>e.mergeNumberFormat(s,t.numberFormats[s])),e}const cl={tag:{type:[String,Object]},locale:{type:String},scope:{type:String,validator:e=>e==="parent"||e==="global",default:"parent"},i18n:{type:Object}};function $_({slots:e},t){return t.length===1&&t[0]==="default"?(e.default?e.default():[]).reduce((s,r)=>[...s,...r.type===he?r.children:[r]],[]):t.reduce((n,s)=>{const r=e[s];return r&&(n[s]=r()),n},de())}function uu(){return he}const V_=Wn({name:"i18n-t",props:Ie({keypath:{type:String,required:!0},plural:{type:[Number,String],validator:e=>Ne(e)||!isNaN(e)}},cl),setup(e,t){const{slots:n,attrs:s}=t,r=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return()=>{const i=Object.keys(n).filter(p=>p[0]!=="_"),l=de();e.locale&&(l.locale=e.locale),e.plural!==void 0&&(l.plural=j(e.plural)?+e.plural:e.plural);const o=$_(t,i),c=r[Ci](e.keypath,o,l),u=Ie(de(),s),a=j(e.tag)||oe(e.tag)?e.tag:uu();return kr(a,u,c)}}}),Ao=V_;function H_(e){return Ee(e)&&!j(e[0])}function fu(e,t,n,s){const{slots:r,attrs:i}=t;return()=>{const l={part:!0};let o=de();e.locale&&(l.locale=e.locale),j(e.format)?l.key=e.format:oe(e.format)&&(j(e.format.key)&&(l.key=e.format.key),o=Object.keys(e.format).reduce((g,L)=>n.includes(L)?Ie(de(),g,{[L]:e.format[L]}):g,de()));const c=s(e.value,l,o);let u=[l.key];Ee(c)?u=c.map((g,L)=>{const O=r[g.type],S=O?O({[g.type]:g.value,index:L,parts:c}):[g.value];return H_(S)&&(S[0].key=`${g.type}-${L}`),S}):j(c)&&(u=[c]);const a=Ie(de(),i),p=j(e.tag)||oe(e.tag)?e.tag:uu();return kr(p,a,u)}}const W_=Wn({name:"i18n-n",props:Ie({value:{type:Number,required:!0},format:{type:[String,Object]}},cl),setup(e,t){const n=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return fu(e,t,su,(...s)=>n[Si](...s))}}),Po=W_;function j_(e,t){const n=e;if(e.mode==="composition")return n.__getInstance(t)||e.global;{const s=n.__getInstance(t);return s!=null?s.__composer:e.global.__composer}}function B_(e){const t=l=>{const{instance:o,value:c}=l;if(!o||!o.$)throw Qe(Ye.UNEXPECTED_ERROR);const u=j_(e,o.$),a=wo(c);return[Reflect.apply(u.t,u,[...Ro(a)]),u]};return{created:(l,o)=>{const[c,u]=t(o);dr&&e.global===u&&(l.__i18nWatcher=wt(u.locale,()=>{o.instance&&o.instance.$forceUpdate()})),l.__composer=u,l.textContent=c},unmounted:l=>{dr&&l.__i18nWatcher&&(l.__i18nWatcher(),l.__i18nWatcher=void 0,delete l.__i18nWatcher),l.__composer&&(l.__composer=void 0,delete l.__composer)},beforeUpdate:(l,{value:o})=>{if(l.__composer){const c=l.__composer,u=wo(o);l.textContent=Reflect.apply(c.t,c,[...Ro(u)])}},getSSRProps:l=>{const[o]=t(l);return{textContent:o}}}}function wo(e){if(j(e))return{path:e};if(Z(e)){if(!("path"in e))throw Qe(Ye.REQUIRED_VALUE,"path");return e}else throw Qe(Ye.INVALID_VALUE)}function Ro(e){const{path:t,locale:n,args:s,choice:r,plural:i}=e,l={},o=s||{};return j(n)&&(l.locale=n),Ne(r)&&(l.plural=r),Ne(i)&&(l.plural=i),[t,o,l]}function K_(e,t,...n){const s=Z(n[0])?n[0]:{};(ie(s.globalInstall)?s.globalInstall:!0)&&([Ao.name,"I18nT"].forEach(i=>e.component(i,Ao)),[Po.name,"I18nN"].forEach(i=>e.component(i,Po)),[xo.name,"I18nD"].forEach(i=>e.component(i,xo))),e.directive("t",B_(t))}const G_=Xt("global-vue-i18n");function Y_(e={}){const t=__VUE_I18N_LEGACY_API__&&ie(e.legacy)?e.legacy:__VUE_I18N_LEGACY_API__,n=ie(e.globalInjection)?e.globalInjection:!0,s=new Map,[r,i]=q_(e,t),l=Xt("");function o(p){return s.get(p)||null}function c(p,g){s.set(p,g)}function u(p){s.delete(p)}const a={get mode(){return __VUE_I18N_LEGACY_API__&&t?"legacy":"composition"},async install(p,...g){if(p.__VUE_I18N_SYMBOL__=l,p.provide(p.__VUE_I18N_SYMBOL__,a),Z(g[0])){const S=g[0];a.__composerExtend=S.__composerExtend,a.__vueI18nExtend=S.__vueI18nExtend}let L=null;!t&&n&&(L=nm(p,a.global)),__VUE_I18N_FULL_INSTALL__&&K_(p,a,...g),__VUE_I18N_LEGACY_API__&&t&&p.mixin(U_(i,i.__composer,a));const O=p.unmount;p.unmount=()=>{L&&L(),a.dispose(),O()}},get global(){return i},dispose(){r.stop()},__instances:s,__getInstance:o,__setInstance:c,__deleteInstance:u};return a}function Ur(e={}){const t=ys();if(t==null)throw Qe(Ye.MUST_BE_CALL_SETUP_TOP);if(!t.isCE&&t.appContext.app!=null&&!t.appContext.app.__VUE_I18N_SYMBOL__)throw Qe(Ye.NOT_INSTALLED);const n=X_(t),s=Q_(n),r=cu(t),i=J_(e,r);if(i==="global")return au(s,e,r),s;if(i==="parent"){let c=Z_(n,t,e.__useComponent);return c==null&&(c=s),c}const l=n;let o=l.__getInstance(t);if(o==null){const c=Ie({},e);"__i18n"in r&&(c.__i18n=r.__i18n),s&&(c.__root=s),o=ol(c),l.__composerExtend&&(o[Ni]=l.__composerExtend(o)),em(l,t,o),l.__setInstance(t,o)}return o}function q_(e,t){const n=Ho(),s=__VUE_I18N_LEGACY_API__&&t?n.run(()=>Ii(e)):n.run(()=>ol(e));if(s==null)throw Qe(Ye.UNEXPECTED_ERROR);return[n,s]}function X_(e){const t=On(e.isCE?G_:e.appContext.app.__VUE_I18N_SYMBOL__);if(!t)throw Qe(e.isCE?Ye.NOT_INSTALLED_WITH_PROVIDE:Ye.UNEXPECTED_ERROR);return t}function J_(e,t){return Fr(e)?"__i18n"in t?"local":"global":e.useScope?e.useScope:"local"}function Q_(e){return e.mode==="composition"?e.global:e.global.__composer}function Z_(e,t,n=!1){let s=null;const r=t.root;let i=z_(t,n);for(;i!=null;){const l=e;if(e.mode==="composition")s=l.__getInstance(i);else if(__VUE_I18N_LEGACY_API__){const o=l.__getInstance(i);o!=null&&(s=o.__composer,n&&s&&!s[ou]&&(s=null))}if(s!=null||r===i)break;i=i.parent}return s}function z_(e,t=!1){return e==null?null:t&&e.vnode.ctx||e.parent}function em(e,t,n){pn(()=>{},t),Ns(()=>{const s=n;e.__deleteInstance(t);const r=s[Ni];r&&(r(),delete s[Ni])},t)}const tm=["locale","fallbackLocale","availableLocales"],ko=["t","rt","d","n","tm","te"];function nm(e,t){const n=Object.create(null);return tm.forEach(r=>{const i=Object.getOwnPropertyDescriptor(t,r);if(!i)throw Qe(Ye.UNEXPECTED_ERROR);const l=Te(i.value)?{get(){return i.value.value},set(o){i.value.value=o}}:{get(){return i.get&&i.get()}};Object.defineProperty(n,r,l)}),e.config.globalProperties.$i18n=n,ko.forEach(r=>{const i=Object.getOwnPropertyDescriptor(t,r);if(!i||!i.value)throw Qe(Ye.UNEXPECTED_ERROR);Object.defineProperty(e.config.globalProperties,`$${r}`,i)}),()=>{delete e.config.globalProperties.$i18n,ko.forEach(r=>{delete e.config.globalProperties[`$${r}`]})}}const sm=Wn({name:"i18n-d",props:Ie({value:{type:[Number,Date],required:!0},format:{type:[String,Object]}},cl),setup(e,t){const n=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return fu(e,t,nu,(...s)=>n[Li](...s))}}),xo=sm;x_();d_(Yp);h_(a_);p_(Ja);if(__INTLIFY_PROD_DEVTOOLS__){const e=rn();e.__INTLIFY__=!0,qp(e.__INTLIFY_DEVTOOLS_GLOBAL_HOOK__)}const rm=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},im={class:"app"},lm={class:"inner"},om={style:{display:"flex","align-items":"center",gap:"8px","margin-bottom":"12px"}},cm={style:{"font-weight":"600"}},am={class:"grid"},um={class:"left"},fm={class:"upload"},dm={class:"files"},hm={class:"file-actions"},pm=["onClick"],_m=["onClick"],mm={class:"right"},gm={class:"llm"},bm=["value"],ym=["placeholder"],Em=["disabled"],Tm={key:0},vm=["value"],Cm={class:"sql"},Lm=["value"],Sm=["disabled"],Nm={key:0,class:"results"},Im={class:"status"},Om={__name:"App",setup(e){const{t,locale:n}=Ur(),s=je([]),r=je(""),i=je("SELECT * FROM data LIMIT 10;"),l=je({columns:[],rows:[]}),o=je(""),c=je(null),u=je(""),a=je("");function p(y){const h=y.replace(/\.xlsx$/i,"");return s.value.some(f=>f===`${h}.db`)}async function g(){try{const y=await Zh();s.value=y.files||[]}catch(y){r.value=t("failedListFiles")+": "+y.message}}async function L(y){const h=y.target.files&&y.target.files[0];if(h)try{const f=await zh(h);r.value=`${t("uploaded")} ${f.filename}`,await g()}catch(f){r.value=t("uploadFailed")+": "+f.message}finally{y.target.value=""}}async function O(y){try{const h=await ep(y);r.value=`${t("converted")}: ${h.db}`,await g()}catch(h){r.value=t("convertFailed")+": "+h.message}}function S(y){window.open(sp(y),"_blank")}async function k(y){try{const h=await tp(y,i.value);l.value=h,r.value=t("querySucceeded")}catch(h){r.value=t("queryFailed")+": "+h.message}}async function b(y){try{const h=await np(y,o.value,"data"),f=h&&(h.sql||h.query||h.generated_sql||h.raw&&(h.raw.sql||h.raw.query));f?(c.value=f,i.value=f):c.value=typeof h=="string"?h:JSON.stringify(h,null,2),r.value=t("llmResponded")}catch(h){r.value=t("llmFailed")+": "+h.message}}return pn(()=>g()),(y,h)=>(Le(),Re("div",im,[X("div",lm,[X("h1",null,be(ye(t)("title")),1),X("div",om,[X("label",cm,be(ye(t)("language"))+":",1),Tn(X("select",{"onUpdate:modelValue":h[0]||(h[0]=f=>Te(n)?n.value=f:null),style:{width:"140px"}},[...h[7]||(h[7]=[X("option",{value:"en"},"English",-1),X("option",{value:"zh"},"中文",-1)])],512),[[rs,ye(n)]])]),X("div",am,[X("div",um,[X("section",fm,[X("h2",null,be(ye(t)("upload")),1),X("input",{type:"file",onChange:L},null,32)]),X("section",dm,[X("h2",null,be(ye(t)("filesInTmp")),1),X("button",{onClick:g},be(ye(t)("refresh")),1),X("ul",null,[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".xlsx")),f=>(Le(),Re("li",{key:f},[X("div",{class:Vn(["file-row",p(f)?"file-ready":"file-missing"])},[X("strong",null,be(f),1),X("div",hm,[X("button",{onClick:T=>O(f)},be(ye(t)("convert")),9,pm),X("button",{onClick:T=>S(f)},be(ye(t)("download")),9,_m)])],2)]))),128))])])]),X("div",mm,[X("section",gm,[X("h2",null,be(ye(t)("llm.title")),1),X("label",null,be(ye(t)("llm.chooseDb")),1),Tn(X("select",{"onUpdate:modelValue":h[1]||(h[1]=f=>a.value=f)},[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".db")),f=>(Le(),Re("option",{key:f,value:f},be(f),9,bm))),128))],512),[[rs,a.value]]),X("div",null,[Tn(X("textarea",{"onUpdate:modelValue":h[2]||(h[2]=f=>o.value=f),rows:"3",placeholder:ye(t)("llm.placeholder")},null,8,ym),[[Fn,o.value]])]),X("div",null,[X("button",{onClick:h[3]||(h[3]=f=>b(a.value)),disabled:!a.value||!o.value},be(ye(t)("llm.ask")),9,Em)]),c.value?(Le(),Re("div",Tm,[X("h3",null,be(ye(t)("llm.result")),1),X("textarea",{value:c.value,readonly:"",rows:"6",style:{width:"100%","white-space":"pre-wrap",overflow:"auto"}},null,8,vm)])):ai("",!0)]),X("section",Cm,[X("h2",null,be(ye(t)("sql.title")),1),X("label",null,be(ye(t)("sql.chooseDb")),1),Tn(X("select",{"onUpdate:modelValue":h[4]||(h[4]=f=>u.value=f)},[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".db")),f=>(Le(),Re("option",{key:f,value:f},be(f),9,Lm))),128))],512),[[rs,u.value]]),X("div",null,[Tn(X("textarea",{"onUpdate:modelValue":h[5]||(h[5]=f=>i.value=f),rows:"7",style:{width:"100%"}},null,512),[[Fn,i.value]])]),X("div",null,[X("button",{onClick:h[6]||(h[6]=f=>k(u.value)),disabled:!u.value},be(ye(t)("sql.run")),9,Sm)]),l.value.rows&&l.value.rows.length?(Le(),Re("div",Nm,[X("h3",null,be(ye(t)("sql.results")),1),X("table",null,[X("thead",null,[X("tr",null,[(Le(!0),Re(he,null,nn(l.value.columns,f=>(Le(),Re("th",{key:f},be(f),1))),128))])]),X("tbody",null,[(Le(!0),Re(he,null,nn(l.value.rows,(f,T)=>(Le(),Re("tr",{key:T},[(Le(!0),Re(he,null,nn(l.value.columns,N=>(Le(),Re("td",{key:N},be(f[N]),1))),128))]))),128))])])])):ai("",!0)])])]),X("section",Im,[h[8]||(h[8]=X("h2",null,"Status",-1)),X("div",null,be(r.value),1)])])]))}},Am=rm(Om,[["__scopeId","data-v-f5479fc1"]]),Pm={en:{title:"Excel → SQLite Explorer",language:"Language",upload:"Upload",filesInTmp:"Files in tmp",refresh:"Refresh",convert:"Convert",download:"Download",llm:{title:"LLM - Generate SQL",chooseDb:"Choose DB",placeholder:"Describe what you want (e.g., total sales by month)",ask:"Ask LLM",result:"LLM Result"},sql:{title:"Run SQL",chooseDb:"Choose DB",run:"Run",results:"Results"},status:"Status",uploaded:"Uploaded",uploadFailed:"Upload failed",converted:"Converted",convertFailed:"Convert failed",failedListFiles:"Failed to list files",querySucceeded:"Query succeeded",queryFailed:"Query failed",llmResponded:"LLM responded",llmFailed:"LLM call failed"},zh:{title:"Excel → SQLite 探索器",language:"语言",upload:"上传",filesInTmp:"tmp 目录文件",refresh:"刷新",convert:"转换",download:"下载",llm:{title:"LLM - 生成 SQL",chooseDb:"选择数据库",placeholder:"描述你想要的（例如：按月销售总额）",ask:"询问 LLM",result:"LLM 结果"},sql:{title:"运行 SQL",chooseDb:"选择数据库",run:"运行",results:"结果"},status:"状态",uploaded:"已上传",uploadFailed:"上传失败",converted:"已转换",convertFailed:"转换失败",failedListFiles:"列出文件失败",querySucceeded:"查询成功",queryFailed:"查询失败",llmResponded:"LLM 已响应",llmFailed:"LLM 调用失败"}},wm=Y_({legacy:!1,locale:"en",fallbackLocale:"en",messages:Pm}),du=fr(Am);du.use(wm);du.mount("#app");
+  */const k_="11.2.8";function x_(){typeof __VUE_I18N_FULL_INSTALL__!="boolean"&&(rn().__VUE_I18N_FULL_INSTALL__=!0),typeof __VUE_I18N_LEGACY_API__!="boolean"&&(rn().__VUE_I18N_LEGACY_API__=!0),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(rn().__INTLIFY_DROP_MESSAGE_COMPILER__=!1),typeof __INTLIFY_PROD_DEVTOOLS__!="boolean"&&(rn().__INTLIFY_PROD_DEVTOOLS__=!1)}const Ye={UNEXPECTED_RETURN_TYPE:Zp,INVALID_ARGUMENT:25,MUST_BE_CALL_SETUP_TOP:26,NOT_INSTALLED:27,REQUIRED_VALUE:28,INVALID_VALUE:29,CANNOT_SETUP_VUE_DEVTOOLS_PLUGIN:30,NOT_INSTALLED_WITH_PROVIDE:31,UNEXPECTED_ERROR:32,NOT_COMPATIBLE_LEGACY_VUE_I18N:33,NOT_AVAILABLE_COMPOSITION_IN_LEGACY:34};function Qe(e,...t){return Mr(e,null,void 0)}const Ci=Xt("__translateVNode"),Li=Xt("__datetimeParts"),Si=Xt("__numberParts"),lu=Xt("__setPluralRules"),ou=Xt("__injectWithOption"),Ni=Xt("__dispose");function bs(e){if(!oe(e)||mt(e))return e;for(const t in e)if(lt(e,t))if(!t.includes("."))oe(e[t])&&bs(e[t]);else{const n=t.split("."),s=n.length-1;let r=e,i=!1;for(let l=0;l<s;l++){if(n[l]==="__proto__")throw new Error(`unsafe key: ${n[l]}`);if(n[l]in r||(r[n[l]]=de()),!oe(r[n[l]])){i=!0;break}r=r[n[l]]}if(i||(mt(r)?Xa.includes(n[s])||delete e[t]:(r[n[s]]=e[t],delete e[t])),!mt(r)){const l=r[n[s]];oe(l)&&bs(l)}}return e}function ll(e,t){const{messages:n,__i18n:s,messageResolver:r,flatJson:i}=t,l=Z(n)?n:Ee(s)?de():{[e]:de()};if(Ee(s)&&s.forEach(o=>{if("locale"in o&&"resource"in o){const{locale:c,resource:u}=o;c?(l[c]=l[c]||de(),qs(u,l[c])):qs(u,l)}else j(o)&&qs(JSON.parse(o),l)}),r==null&&i)for(const o in l)lt(l,o)&&bs(l[o]);return l}function cu(e){return e.type}function au(e,t,n){let s=oe(t.messages)?t.messages:de();"__i18nGlobal"in n&&(s=ll(e.locale.value,{messages:s,__i18n:n.__i18nGlobal}));const r=Object.keys(s);r.length&&r.forEach(i=>{e.mergeLocaleMessage(i,s[i])});{if(oe(t.datetimeFormats)){const i=Object.keys(t.datetimeFormats);i.length&&i.forEach(l=>{e.mergeDateTimeFormat(l,t.datetimeFormats[l])})}if(oe(t.numberFormats)){const i=Object.keys(t.numberFormats);i.length&&i.forEach(l=>{e.mergeNumberFormat(l,t.numberFormats[l])})}}}function Co(e){return ge(kt,null,e,0)}function ys(){const e="currentInstance";return e in eo?eo[e]:Ve()}const Lo="__INTLIFY_META__",So=()=>[],F_=()=>!1;let No=0;function Io(e){return(t,n,s,r)=>e(n,s,ys()||void 0,r)}const M_=()=>{const e=ys();let t=null;return e&&(t=cu(e)[Lo])?{[Lo]:t}:null};function ol(e={}){const{__root:t,__injectWithOption:n}=e,s=t===void 0,r=e.flatJson,i=dr?je:Fi;let l=ie(e.inheritLocale)?e.inheritLocale:!0;const o=i(t&&l?t.locale.value:j(e.locale)?e.locale:gs),c=i(t&&l?t.fallbackLocale.value:j(e.fallbackLocale)||Ee(e.fallbackLocale)||Z(e.fallbackLocale)||e.fallbackLocale===!1?e.fallbackLocale:o.value),u=i(ll(o.value,e)),a=i(Z(e.datetimeFormats)?e.datetimeFormats:{[o.value]:{}}),p=i(Z(e.numberFormats)?e.numberFormats:{[o.value]:{}});let g=t?t.missingWarn:ie(e.missingWarn)||Dn(e.missingWarn)?e.missingWarn:!0,L=t?t.fallbackWarn:ie(e.fallbackWarn)||Dn(e.fallbackWarn)?e.fallbackWarn:!0,O=t?t.fallbackRoot:ie(e.fallbackRoot)?e.fallbackRoot:!0,S=!!e.fallbackFormat,k=me(e.missing)?e.missing:null,b=me(e.missing)?Io(e.missing):null,y=me(e.postTranslation)?e.postTranslation:null,h=t?t.warnHtmlMessage:ie(e.warnHtmlMessage)?e.warnHtmlMessage:!0,f=!!e.escapeParameter;const T=t?t.modifiers:Z(e.modifiers)?e.modifiers:{};let N=e.pluralRules||t&&t.pluralRules,I;I=(()=>{s&&po(null);const E={version:k_,locale:o.value,fallbackLocale:c.value,messages:u.value,modifiers:T,pluralRules:N,missing:b===null?void 0:b,missingWarn:g,fallbackWarn:L,fallbackFormat:S,unresolving:!0,postTranslation:y===null?void 0:y,warnHtmlMessage:h,escapeParameter:f,messageResolver:e.messageResolver,messageCompiler:e.messageCompiler,__meta:{framework:"vue"}};E.datetimeFormats=a.value,E.numberFormats=p.value,E.__datetimeFormatters=Z(I)?I.__datetimeFormatters:void 0,E.__numberFormatters=Z(I)?I.__numberFormatters:void 0;const A=b_(E);return s&&po(A),A})(),Xn(I,o.value,c.value);function x(){return[o.value,c.value,u.value,a.value,p.value]}const D=sn({get:()=>o.value,set:E=>{I.locale=E,o.value=E}}),W=sn({get:()=>c.value,set:E=>{I.fallbackLocale=E,c.value=E,Xn(I,o.value,E)}}),F=sn(()=>u.value),Y=sn(()=>a.value),z=sn(()=>p.value);function fe(){return me(y)?y:null}function G(E){y=E,I.postTranslation=E}function Q(){return k}function B(E){E!==null&&(b=Io(E)),k=E,I.missing=b}const te=(E,A,H,q,ne,se)=>{x();let ve;try{__INTLIFY_PROD_DEVTOOLS__,s||(I.fallbackContext=t?g_():void 0),ve=E(I)}finally{__INTLIFY_PROD_DEVTOOLS__,s||(I.fallbackContext=void 0)}if(H!=="translate exists"&&Ne(ve)&&ve===Dr||H==="translate exists"&&!ve){const[Oe,ze]=A();return t&&O?q(t):ne(Oe)}else{if(se(ve))return ve;throw Qe(Ye.UNEXPECTED_RETURN_TYPE)}};function yt(...E){return te(A=>Reflect.apply(vo,null,[A,...E]),()=>vi(...E),"translate",A=>Reflect.apply(A.t,A,[...E]),A=>A,A=>j(A))}function Ze(...E){const[A,H,q]=E;if(q&&!oe(q))throw Qe(Ye.INVALID_ARGUMENT);return yt(A,H,Ie({resolvedMessage:!0},q||{}))}function He(...E){return te(A=>Reflect.apply(mo,null,[A,...E]),()=>Ei(...E),"datetime format",A=>Reflect.apply(A.d,A,[...E]),()=>fo,A=>j(A)||Ee(A))}function _n(...E){return te(A=>Reflect.apply(bo,null,[A,...E]),()=>Ti(...E),"number format",A=>Reflect.apply(A.n,A,[...E]),()=>fo,A=>j(A)||Ee(A))}function Bn(E){return E.map(A=>j(A)||Ne(A)||ie(A)?Co(String(A)):A)}const Et={normalize:Bn,interpolate:E=>E,type:"vnode"};function $t(...E){return te(A=>{let H;const q=A;try{q.processor=Et,H=Reflect.apply(vo,null,[q,...E])}finally{q.processor=null}return H},()=>vi(...E),"translate",A=>A[Ci](...E),A=>[Co(A)],A=>Ee(A))}function Vt(...E){return te(A=>Reflect.apply(bo,null,[A,...E]),()=>Ti(...E),"number format",A=>A[Si](...E),So,A=>j(A)||Ee(A))}function mn(...E){return te(A=>Reflect.apply(mo,null,[A,...E]),()=>Ei(...E),"datetime format",A=>A[Li](...E),So,A=>j(A)||Ee(A))}function rt(E){N=E,I.pluralRules=N}function Zt(E,A){return te(()=>{if(!E)return!1;const H=j(A)?A:o.value,q=v(H),ne=I.messageResolver(q,E);return mt(ne)||tt(ne)||j(ne)},()=>[E],"translate exists",H=>Reflect.apply(H.te,H,[E,A]),F_,H=>ie(H))}function zt(E){let A=null;const H=Ja(I,c.value,o.value);for(let q=0;q<H.length;q++){const ne=u.value[H[q]]||{},se=I.messageResolver(ne,E);if(se!=null){A=se;break}}return A}function m(E){const A=zt(E);return A??(t?t.tm(E)||{}:{})}function v(E){return u.value[E]||{}}function w(E,A){if(r){const H={[E]:A};for(const q in H)lt(H,q)&&bs(H[q]);A=H[E]}u.value[E]=A,I.messages=u.value}function U(E,A){u.value[E]=u.value[E]||{};const H={[E]:A};if(r)for(const q in H)lt(H,q)&&bs(H[q]);A=H[E],qs(A,u.value[E]),I.messages=u.value}function M(E){return a.value[E]||{}}function d(E,A){a.value[E]=A,I.datetimeFormats=a.value,go(I,E,A)}function _(E,A){a.value[E]=Ie(a.value[E]||{},A),I.datetimeFormats=a.value,go(I,E,A)}function C(E){return p.value[E]||{}}function P(E,A){p.value[E]=A,I.numberFormats=p.value,yo(I,E,A)}function R(E,A){p.value[E]=Ie(p.value[E]||{},A),I.numberFormats=p.value,yo(I,E,A)}No++,t&&dr&&(wt(t.locale,E=>{l&&(o.value=E,I.locale=E,Xn(I,o.value,c.value))}),wt(t.fallbackLocale,E=>{l&&(c.value=E,I.fallbackLocale=E,Xn(I,o.value,c.value))}));const V={id:No,locale:D,fallbackLocale:W,get inheritLocale(){return l},set inheritLocale(E){l=E,E&&t&&(o.value=t.locale.value,c.value=t.fallbackLocale.value,Xn(I,o.value,c.value))},get availableLocales(){return Object.keys(u.value).sort()},messages:F,get modifiers(){return T},get pluralRules(){return N||{}},get isGlobal(){return s},get missingWarn(){return g},set missingWarn(E){g=E,I.missingWarn=g},get fallbackWarn(){return L},set fallbackWarn(E){L=E,I.fallbackWarn=L},get fallbackRoot(){return O},set fallbackRoot(E){O=E},get fallbackFormat(){return S},set fallbackFormat(E){S=E,I.fallbackFormat=S},get warnHtmlMessage(){return h},set warnHtmlMessage(E){h=E,I.warnHtmlMessage=E},get escapeParameter(){return f},set escapeParameter(E){f=E,I.escapeParameter=E},t:yt,getLocaleMessage:v,setLocaleMessage:w,mergeLocaleMessage:U,getPostTranslationHandler:fe,setPostTranslationHandler:G,getMissingHandler:Q,setMissingHandler:B,[lu]:rt};return V.datetimeFormats=Y,V.numberFormats=z,V.rt=Ze,V.te=Zt,V.tm=m,V.d=He,V.n=_n,V.getDateTimeFormat=M,V.setDateTimeFormat=d,V.mergeDateTimeFormat=_,V.getNumberFormat=C,V.setNumberFormat=P,V.mergeNumberFormat=R,V[ou]=n,V[Ci]=$t,V[Li]=mn,V[Si]=Vt,V}function D_(e){const t=j(e.locale)?e.locale:gs,n=j(e.fallbackLocale)||Ee(e.fallbackLocale)||Z(e.fallbackLocale)||e.fallbackLocale===!1?e.fallbackLocale:t,s=me(e.missing)?e.missing:void 0,r=ie(e.silentTranslationWarn)||Dn(e.silentTranslationWarn)?!e.silentTranslationWarn:!0,i=ie(e.silentFallbackWarn)||Dn(e.silentFallbackWarn)?!e.silentFallbackWarn:!0,l=ie(e.fallbackRoot)?e.fallbackRoot:!0,o=!!e.formatFallbackMessages,c=Z(e.modifiers)?e.modifiers:{},u=e.pluralizationRules,a=me(e.postTranslation)?e.postTranslation:void 0,p=j(e.warnHtmlInMessage)?e.warnHtmlInMessage!=="off":!0,g=!!e.escapeParameterHtml,L=ie(e.sync)?e.sync:!0;let O=e.messages;if(Z(e.sharedMessages)){const T=e.sharedMessages;O=Object.keys(T).reduce((I,$)=>{const x=I[$]||(I[$]={});return Ie(x,T[$]),I},O||{})}const{__i18n:S,__root:k,__injectWithOption:b}=e,y=e.datetimeFormats,h=e.numberFormats,f=e.flatJson;return{locale:t,fallbackLocale:n,messages:O,flatJson:f,datetimeFormats:y,numberFormats:h,missing:s,missingWarn:r,fallbackWarn:i,fallbackRoot:l,fallbackFormat:o,modifiers:c,pluralRules:u,postTranslation:a,warnHtmlMessage:p,escapeParameter:g,messageResolver:e.messageResolver,inheritLocale:L,__i18n:S,__root:k,__injectWithOption:b}}function Ii(e={}){const t=ol(D_(e)),{__extender:n}=e,s={id:t.id,get locale(){return t.locale.value},set locale(r){t.locale.value=r},get fallbackLocale(){return t.fallbackLocale.value},set fallbackLocale(r){t.fallbackLocale.value=r},get messages(){return t.messages.value},get datetimeFormats(){return t.datetimeFormats.value},get numberFormats(){return t.numberFormats.value},get availableLocales(){return t.availableLocales},get missing(){return t.getMissingHandler()},set missing(r){t.setMissingHandler(r)},get silentTranslationWarn(){return ie(t.missingWarn)?!t.missingWarn:t.missingWarn},set silentTranslationWarn(r){t.missingWarn=ie(r)?!r:r},get silentFallbackWarn(){return ie(t.fallbackWarn)?!t.fallbackWarn:t.fallbackWarn},set silentFallbackWarn(r){t.fallbackWarn=ie(r)?!r:r},get modifiers(){return t.modifiers},get formatFallbackMessages(){return t.fallbackFormat},set formatFallbackMessages(r){t.fallbackFormat=r},get postTranslation(){return t.getPostTranslationHandler()},set postTranslation(r){t.setPostTranslationHandler(r)},get sync(){return t.inheritLocale},set sync(r){t.inheritLocale=r},get warnHtmlInMessage(){return t.warnHtmlMessage?"warn":"off"},set warnHtmlInMessage(r){t.warnHtmlMessage=r!=="off"},get escapeParameterHtml(){return t.escapeParameter},set escapeParameterHtml(r){t.escapeParameter=r},get pluralizationRules(){return t.pluralRules||{}},__composer:t,t(...r){return Reflect.apply(t.t,t,[...r])},rt(...r){return Reflect.apply(t.rt,t,[...r])},te(r,i){return t.te(r,i)},tm(r){return t.tm(r)},getLocaleMessage(r){return t.getLocaleMessage(r)},setLocaleMessage(r,i){t.setLocaleMessage(r,i)},mergeLocaleMessage(r,i){t.mergeLocaleMessage(r,i)},d(...r){return Reflect.apply(t.d,t,[...r])},getDateTimeFormat(r){return t.getDateTimeFormat(r)},setDateTimeFormat(r,i){t.setDateTimeFormat(r,i)},mergeDateTimeFormat(r,i){t.mergeDateTimeFormat(r,i)},n(...r){return Reflect.apply(t.n,t,[...r])},getNumberFormat(r){return t.getNumberFormat(r)},setNumberFormat(r,i){t.setNumberFormat(r,i)},mergeNumberFormat(r,i){t.mergeNumberFormat(r,i)}};return s.__extender=n,s}function U_(e,t,n){return{beforeCreate(){const s=ys();if(!s)throw Qe(Ye.UNEXPECTED_ERROR);const r=this.$options;if(r.i18n){const i=r.i18n;if(r.__i18n&&(i.__i18n=r.__i18n),i.__root=t,this===this.$root)this.$i18n=Oo(e,i);else{i.__injectWithOption=!0,i.__extender=n.__vueI18nExtend,this.$i18n=Ii(i);const l=this.$i18n;l.__extender&&(l.__disposer=l.__extender(this.$i18n))}}else if(r.__i18n)if(this===this.$root)this.$i18n=Oo(e,r);else{this.$i18n=Ii({__i18n:r.__i18n,__injectWithOption:!0,__extender:n.__vueI18nExtend,__root:t});const i=this.$i18n;i.__extender&&(i.__disposer=i.__extender(this.$i18n))}else this.$i18n=e;r.__i18nGlobal&&au(t,r,r),this.$t=(...i)=>this.$i18n.t(...i),this.$rt=(...i)=>this.$i18n.rt(...i),this.$te=(i,l)=>this.$i18n.te(i,l),this.$d=(...i)=>this.$i18n.d(...i),this.$n=(...i)=>this.$i18n.n(...i),this.$tm=i=>this.$i18n.tm(i),n.__setInstance(s,this.$i18n)},mounted(){},unmounted(){const s=ys();if(!s)throw Qe(Ye.UNEXPECTED_ERROR);const r=this.$i18n;delete this.$t,delete this.$rt,delete this.$te,delete this.$d,delete this.$n,delete this.$tm,r.__disposer&&(r.__disposer(),delete r.__disposer,delete r.__extender),n.__deleteInstance(s),delete this.$i18n}}}function Oo(e,t){e.locale=t.locale||e.locale,e.fallbackLocale=t.fallbackLocale||e.fallbackLocale,e.missing=t.missing||e.missing,e.silentTranslationWarn=t.silentTranslationWarn||e.silentFallbackWarn,e.silentFallbackWarn=t.silentFallbackWarn||e.silentFallbackWarn,e.formatFallbackMessages=t.formatFallbackMessages||e.formatFallbackMessages,e.postTranslation=t.postTranslation||e.postTranslation,e.warnHtmlInMessage=t.warnHtmlInMessage||e.warnHtmlInMessage,e.escapeParameterHtml=t.escapeParameterHtml||e.escapeParameterHtml,e.sync=t.sync||e.sync,e.__composer[lu](t.pluralizationRules||e.pluralizationRules);const n=ll(e.locale,{messages:t.messages,__i18n:t.__i18n});return Object.keys(n).forEach(s=>e.mergeLocaleMessage(s,n[s])),t.datetimeFormats&&Object.keys(t.datetimeFormats).forEach(s=>e.mergeDateTimeFormat(s,t.datetimeFormats[s])),t.numberFormats&&Object.keys(t.numberFormats).forEach(s=>e.mergeNumberFormat(s,t.numberFormats[s])),e}const cl={tag:{type:[String,Object]},locale:{type:String},scope:{type:String,validator:e=>e==="parent"||e==="global",default:"parent"},i18n:{type:Object}};function $_({slots:e},t){return t.length===1&&t[0]==="default"?(e.default?e.default():[]).reduce((s,r)=>[...s,...r.type===he?r.children:[r]],[]):t.reduce((n,s)=>{const r=e[s];return r&&(n[s]=r()),n},de())}function uu(){return he}const V_=Wn({name:"i18n-t",props:Ie({keypath:{type:String,required:!0},plural:{type:[Number,String],validator:e=>Ne(e)||!isNaN(e)}},cl),setup(e,t){const{slots:n,attrs:s}=t,r=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return()=>{const i=Object.keys(n).filter(p=>p[0]!=="_"),l=de();e.locale&&(l.locale=e.locale),e.plural!==void 0&&(l.plural=j(e.plural)?+e.plural:e.plural);const o=$_(t,i),c=r[Ci](e.keypath,o,l),u=Ie(de(),s),a=j(e.tag)||oe(e.tag)?e.tag:uu();return kr(a,u,c)}}}),Ao=V_;function H_(e){return Ee(e)&&!j(e[0])}function fu(e,t,n,s){const{slots:r,attrs:i}=t;return()=>{const l={part:!0};let o=de();e.locale&&(l.locale=e.locale),j(e.format)?l.key=e.format:oe(e.format)&&(j(e.format.key)&&(l.key=e.format.key),o=Object.keys(e.format).reduce((g,L)=>n.includes(L)?Ie(de(),g,{[L]:e.format[L]}):g,de()));const c=s(e.value,l,o);let u=[l.key];Ee(c)?u=c.map((g,L)=>{const O=r[g.type],S=O?O({[g.type]:g.value,index:L,parts:c}):[g.value];return H_(S)&&(S[0].key=`${g.type}-${L}`),S}):j(c)&&(u=[c]);const a=Ie(de(),i),p=j(e.tag)||oe(e.tag)?e.tag:uu();return kr(p,a,u)}}const W_=Wn({name:"i18n-n",props:Ie({value:{type:Number,required:!0},format:{type:[String,Object]}},cl),setup(e,t){const n=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return fu(e,t,su,(...s)=>n[Si](...s))}}),Po=W_;function j_(e,t){const n=e;if(e.mode==="composition")return n.__getInstance(t)||e.global;{const s=n.__getInstance(t);return s!=null?s.__composer:e.global.__composer}}function B_(e){const t=l=>{const{instance:o,value:c}=l;if(!o||!o.$)throw Qe(Ye.UNEXPECTED_ERROR);const u=j_(e,o.$),a=wo(c);return[Reflect.apply(u.t,u,[...Ro(a)]),u]};return{created:(l,o)=>{const[c,u]=t(o);dr&&e.global===u&&(l.__i18nWatcher=wt(u.locale,()=>{o.instance&&o.instance.$forceUpdate()})),l.__composer=u,l.textContent=c},unmounted:l=>{dr&&l.__i18nWatcher&&(l.__i18nWatcher(),l.__i18nWatcher=void 0,delete l.__i18nWatcher),l.__composer&&(l.__composer=void 0,delete l.__composer)},beforeUpdate:(l,{value:o})=>{if(l.__composer){const c=l.__composer,u=wo(o);l.textContent=Reflect.apply(c.t,c,[...Ro(u)])}},getSSRProps:l=>{const[o]=t(l);return{textContent:o}}}}function wo(e){if(j(e))return{path:e};if(Z(e)){if(!("path"in e))throw Qe(Ye.REQUIRED_VALUE,"path");return e}else throw Qe(Ye.INVALID_VALUE)}function Ro(e){const{path:t,locale:n,args:s,choice:r,plural:i}=e,l={},o=s||{};return j(n)&&(l.locale=n),Ne(r)&&(l.plural=r),Ne(i)&&(l.plural=i),[t,o,l]}function K_(e,t,...n){const s=Z(n[0])?n[0]:{};(ie(s.globalInstall)?s.globalInstall:!0)&&([Ao.name,"I18nT"].forEach(i=>e.component(i,Ao)),[Po.name,"I18nN"].forEach(i=>e.component(i,Po)),[xo.name,"I18nD"].forEach(i=>e.component(i,xo))),e.directive("t",B_(t))}const G_=Xt("global-vue-i18n");function Y_(e={}){const t=__VUE_I18N_LEGACY_API__&&ie(e.legacy)?e.legacy:__VUE_I18N_LEGACY_API__,n=ie(e.globalInjection)?e.globalInjection:!0,s=new Map,[r,i]=q_(e,t),l=Xt("");function o(p){return s.get(p)||null}function c(p,g){s.set(p,g)}function u(p){s.delete(p)}const a={get mode(){return __VUE_I18N_LEGACY_API__&&t?"legacy":"composition"},async install(p,...g){if(p.__VUE_I18N_SYMBOL__=l,p.provide(p.__VUE_I18N_SYMBOL__,a),Z(g[0])){const S=g[0];a.__composerExtend=S.__composerExtend,a.__vueI18nExtend=S.__vueI18nExtend}let L=null;!t&&n&&(L=nm(p,a.global)),__VUE_I18N_FULL_INSTALL__&&K_(p,a,...g),__VUE_I18N_LEGACY_API__&&t&&p.mixin(U_(i,i.__composer,a));const O=p.unmount;p.unmount=()=>{L&&L(),a.dispose(),O()}},get global(){return i},dispose(){r.stop()},__instances:s,__getInstance:o,__setInstance:c,__deleteInstance:u};return a}function Ur(e={}){const t=ys();if(t==null)throw Qe(Ye.MUST_BE_CALL_SETUP_TOP);if(!t.isCE&&t.appContext.app!=null&&!t.appContext.app.__VUE_I18N_SYMBOL__)throw Qe(Ye.NOT_INSTALLED);const n=X_(t),s=Q_(n),r=cu(t),i=J_(e,r);if(i==="global")return au(s,e,r),s;if(i==="parent"){let c=Z_(n,t,e.__useComponent);return c==null&&(c=s),c}const l=n;let o=l.__getInstance(t);if(o==null){const c=Ie({},e);"__i18n"in r&&(c.__i18n=r.__i18n),s&&(c.__root=s),o=ol(c),l.__composerExtend&&(o[Ni]=l.__composerExtend(o)),em(l,t,o),l.__setInstance(t,o)}return o}function q_(e,t){const n=Ho(),s=__VUE_I18N_LEGACY_API__&&t?n.run(()=>Ii(e)):n.run(()=>ol(e));if(s==null)throw Qe(Ye.UNEXPECTED_ERROR);return[n,s]}function X_(e){const t=On(e.isCE?G_:e.appContext.app.__VUE_I18N_SYMBOL__);if(!t)throw Qe(e.isCE?Ye.NOT_INSTALLED_WITH_PROVIDE:Ye.UNEXPECTED_ERROR);return t}function J_(e,t){return Fr(e)?"__i18n"in t?"local":"global":e.useScope?e.useScope:"local"}function Q_(e){return e.mode==="composition"?e.global:e.global.__composer}function Z_(e,t,n=!1){let s=null;const r=t.root;let i=z_(t,n);for(;i!=null;){const l=e;if(e.mode==="composition")s=l.__getInstance(i);else if(__VUE_I18N_LEGACY_API__){const o=l.__getInstance(i);o!=null&&(s=o.__composer,n&&s&&!s[ou]&&(s=null))}if(s!=null||r===i)break;i=i.parent}return s}function z_(e,t=!1){return e==null?null:t&&e.vnode.ctx||e.parent}function em(e,t,n){pn(()=>{},t),Ns(()=>{const s=n;e.__deleteInstance(t);const r=s[Ni];r&&(r(),delete s[Ni])},t)}const tm=["locale","fallbackLocale","availableLocales"],ko=["t","rt","d","n","tm","te"];function nm(e,t){const n=Object.create(null);return tm.forEach(r=>{const i=Object.getOwnPropertyDescriptor(t,r);if(!i)throw Qe(Ye.UNEXPECTED_ERROR);const l=Te(i.value)?{get(){return i.value.value},set(o){i.value.value=o}}:{get(){return i.get&&i.get()}};Object.defineProperty(n,r,l)}),e.config.globalProperties.$i18n=n,ko.forEach(r=>{const i=Object.getOwnPropertyDescriptor(t,r);if(!i||!i.value)throw Qe(Ye.UNEXPECTED_ERROR);Object.defineProperty(e.config.globalProperties,`$${r}`,i)}),()=>{delete e.config.globalProperties.$i18n,ko.forEach(r=>{delete e.config.globalProperties[`$${r}`]})}}const sm=Wn({name:"i18n-d",props:Ie({value:{type:[Number,Date],required:!0},format:{type:[String,Object]}},cl),setup(e,t){const n=e.i18n||Ur({useScope:e.scope,__useComponent:!0});return fu(e,t,nu,(...s)=>n[Li](...s))}}),xo=sm;x_();d_(Yp);h_(a_);p_(Ja);if(__INTLIFY_PROD_DEVTOOLS__){const e=rn();e.__INTLIFY__=!0,qp(e.__INTLIFY_DEVTOOLS_GLOBAL_HOOK__)}const rm=(e,t)=>{const n=e.__vccOpts||e;for(const[s,r]of t)n[s]=r;return n},im={class:"app"},lm={class:"inner"},om={style:{display:"flex","align-items":"center",gap:"8px","margin-bottom":"12px"}},cm={style:{"font-weight":"600"}},am={class:"grid"},um={class:"left"},fm={class:"upload"},dm={class:"files"},hm={class:"file-actions"},pm=["onClick"],_m=["onClick"],mm={class:"right"},gm={class:"llm"},bm=["value"],ym=["placeholder"],Em=["disabled"],Tm={key:0},vm=["value"],Cm={class:"sql"},Lm=["value"],Sm=["disabled"],Nm={key:0,class:"results"},Im={class:"status"},Om={__name:"App",setup(e){const{t,locale:n}=Ur(),s=je([]),r=je(""),i=je("SELECT * FROM data LIMIT 10;"),l=je({columns:[],rows:[]}),o=je(""),c=je(null),u=je(""),a=je("");function p(y){const h=y.replace(/\.xlsx$/i,"");return s.value.some(f=>f===`${h}.db`)}async function g(){try{const y=await Zh();s.value=y.files||[]}catch(y){r.value=t("failedListFiles")+": "+y.message}}async function L(y){const h=y.target.files&&y.target.files[0];if(h)try{const f=await zh(h);r.value=`${t("uploaded")} ${f.filename}`,await g()}catch(f){r.value=t("uploadFailed")+": "+f.message}finally{y.target.value=""}}async function O(y){try{const h=await ep(y);r.value=`${t("converted")}: ${h.db}`,await g()}catch(h){r.value=t("convertFailed")+": "+h.message}}function S(y){window.open(sp(y),"_blank")}async function k(y){try{const h=await tp(y,i.value);l.value=h,r.value=t("querySucceeded")}catch(h){r.value=t("queryFailed")+": "+h.message}}async function b(y){try{const h=await np(y,o.value,"data"),f=h&&(h.sql||h.query||h.generated_sql||h.raw&&(h.raw.sql||h.raw.query));f?(c.value=f,i.value=f):c.value=typeof h=="string"?h:JSON.stringify(h,null,2),r.value=t("llmResponded")}catch(h){r.value=t("llmFailed")+": "+h.message}}return pn(()=>g()),(y,h)=>(Le(),Re("div",im,[X("div",lm,[X("h1",null,be(ye(t)("title")),1),X("div",om,[X("label",cm,be(ye(t)("language"))+":",1),Tn(X("select",{"onUpdate:modelValue":h[0]||(h[0]=f=>Te(n)?n.value=f:null),style:{width:"140px"}},[...h[7]||(h[7]=[X("option",{value:"en"},"English",-1),X("option",{value:"zh"},"中文",-1)])],512),[[rs,ye(n)]])]),X("div",am,[X("div",um,[X("section",fm,[X("h2",null,be(ye(t)("upload")),1),X("input",{type:"file",onChange:L},null,32)]),X("section",dm,[X("h2",null,be(ye(t)("filesInTmp")),1),X("button",{onClick:g},be(ye(t)("refresh")),1),X("ul",null,[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".xlsx")),f=>(Le(),Re("li",{key:f},[X("div",{class:Vn(["file-row",p(f)?"file-ready":"file-missing"])},[X("strong",null,be(f),1),X("div",hm,[X("button",{onClick:T=>O(f)},be(ye(t)("convert")),9,pm),X("button",{onClick:T=>S(f)},be(ye(t)("download")),9,_m)])],2)]))),128))])])]),X("div",mm,[X("section",gm,[X("h2",null,be(ye(t)("llm.title")),1),X("label",null,be(ye(t)("llm.chooseDb")),1),Tn(X("select",{"onUpdate:modelValue":h[1]||(h[1]=f=>a.value=f)},[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".db")),f=>(Le(),Re("option",{key:f,value:f},be(f),9,bm))),128))],512),[[rs,a.value]]),X("div",null,[Tn(X("textarea",{"onUpdate:modelValue":h[2]||(h[2]=f=>o.value=f),rows:"3",placeholder:ye(t)("llm.placeholder")},null,8,ym),[[Fn,o.value]])]),X("div",null,[X("button",{onClick:h[3]||(h[3]=f=>b(a.value)),disabled:!a.value||!o.value},be(ye(t)("llm.ask")),9,Em)]),c.value?(Le(),Re("div",Tm,[X("h3",null,be(ye(t)("llm.result")),1),X("textarea",{value:c.value,readonly:"",rows:"6",style:{width:"100%","white-space":"pre-wrap",overflow:"auto"}},null,8,vm)])):ai("",!0)]),X("section",Cm,[X("h2",null,be(ye(t)("sql.title")),1),X("label",null,be(ye(t)("sql.chooseDb")),1),Tn(X("select",{"onUpdate:modelValue":h[4]||(h[4]=f=>u.value=f)},[(Le(!0),Re(he,null,nn(s.value.filter(f=>f.endsWith(".db")),f=>(Le(),Re("option",{key:f,value:f},be(f),9,Lm))),128))],512),[[rs,u.value]]),X("div",null,[Tn(X("textarea",{"onUpdate:modelValue":h[5]||(h[5]=f=>i.value=f),rows:"7",style:{width:"100%"}},null,512),[[Fn,i.value]])]),X("div",null,[X("button",{onClick:h[6]||(h[6]=f=>k(u.value)),disabled:!u.value},be(ye(t)("sql.run")),9,Sm)]),l.value.rows&&l.value.rows.length?(Le(),Re("div",Nm,[X("h3",null,be(ye(t)("sql.results")),1),X("table",null,[X("thead",null,[X("tr",null,[(Le(!0),Re(he,null,nn(l.value.columns,f=>(Le(),Re("th",{key:f},be(f),1))),128))])]),X("tbody",null,[(Le(!0),Re(he,null,nn(l.value.rows,(f,T)=>(Le(),Re("tr",{key:T},[(Le(!0),Re(he,null,nn(l.value.columns,(N,K)=>(Le(),Re("td",{key:N},be(f[K]),1))),128))]))),128))])])])):ai("",!0)])])]),X("section",Im,[h[8]||(h[8]=X("h2",null,"Status",-1)),X("div",null,be(r.value),1)])])]))}},Am=rm(Om,[["__scopeId","data-v-f5479fc1"]]),Pm={en:{title:"Excel → SQLite Explorer",language:"Language",upload:"Upload",filesInTmp:"Files in tmp",refresh:"Refresh",convert:"Convert",download:"Download",llm:{title:"LLM - Generate SQL",chooseDb:"Choose DB",placeholder:"Describe what you want (e.g., total sales by month)",ask:"Ask LLM",result:"LLM Result"},sql:{title:"Run SQL",chooseDb:"Choose DB",run:"Run",results:"Results"},status:"Status",uploaded:"Uploaded",uploadFailed:"Upload failed",converted:"Converted",convertFailed:"Convert failed",failedListFiles:"Failed to list files",querySucceeded:"Query succeeded",queryFailed:"Query failed",llmResponded:"LLM responded",llmFailed:"LLM call failed"},zh:{title:"Excel → SQLite 探索器",language:"语言",upload:"上传",filesInTmp:"tmp 目录文件",refresh:"刷新",convert:"转换",download:"下载",llm:{title:"LLM - 生成 SQL",chooseDb:"选择数据库",placeholder:"描述你想要的（例如：按月销售总额）",ask:"询问 LLM",result:"LLM 结果"},sql:{title:"运行 SQL",chooseDb:"选择数据库",run:"运行",results:"结果"},status:"状态",uploaded:"已上传",uploadFailed:"上传失败",converted:"已转换",convertFailed:"转换失败",failedListFiles:"列出文件失败",querySucceeded:"查询成功",queryFailed:"查询失败",llmResponded:"LLM 已响应",llmFailed:"LLM 调用失败"}},wm=Y_({legacy:!1,locale:"en",fallbackLocale:"en",messages:Pm}),du=fr(Am);du.use(wm);du.mount("#app");